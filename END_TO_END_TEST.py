@@ -7,10 +7,23 @@
 """
 
 import os
+import re
 import json
 import time
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+def load_json(path):
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
 print()
 print("╔══════════════════════════════════════════════════════════════════════╗")
@@ -21,6 +34,21 @@ print()
 start_time = time.time()
 test_results = {}
 
+# Tests 3-7 read independent JSON files; start all reads now so they overlap
+# with the inventory and LAS tests. Each test collects its own result, so a
+# missing file still only fails that test.
+io_pool = ThreadPoolExecutor()
+json_inputs = {
+    path: io_pool.submit(load_json, path)
+    for path in (
+        'risk_scores.json',
+        'fast_results.json',
+        'vision_three_4d_export.json',
+        'decay_assessment.json',
+        'downtime_scorecard.json',
+    )
+}
+
 # ==============================================================================
 # TEST 1: FILE INVENTORY
 # ==============================================================================
@@ -34,9 +62,20 @@ las_dir = "brahan_engine_data/las_files"
 pdf_dir = "brahan_engine_data/pdf_files"
 tiff_dir = "brahan_engine_data/tiff_files"
 
-las_files = [f for f in os.listdir(las_dir) if f.endswith('.las')] if os.path.exists(las_dir) else []
-pdf_files = [f for f in os.listdir(pdf_dir) if f.endswith('.pdf')] if os.path.exists(pdf_dir) else []
-tiff_files = [f for f in os.listdir(tiff_dir) if f.lower().endswith(('.tiff', '.tif'))] if os.path.exists(tiff_dir) else []
+def _list_ext(d, exts, lower=False):
+    """List file names in d ending with exts (empty if d is missing)"""
+    try:
+        with os.scandir(d) as it:
+            return [
+                e.name for e in it
+                if e.is_file() and (e.name.lower() if lower else e.name).endswith(exts)
+            ]
+    except FileNotFoundError:
+        return []
+
+las_files = _list_ext(las_dir, '.las')
+pdf_files = _list_ext(pdf_dir, '.pdf')
+tiff_files = _list_ext(tiff_dir, ('.tiff', '.tif'), lower=True)
 
 test_results["inventory"] = {
     "las": len(las_files),
@@ -60,22 +99,44 @@ print("TEST 2: LAS PARSING")
 print("=" * 70)
 print()
 
-wells_found = set()
-total_depth = 0
+# "WELL.  <name> : <description>" header line; captures <name>.
+# Matched against an upper-cased copy of the header, so no IGNORECASE.
+WELL_LINE_RE = re.compile(rb'(?m)^[ \t]*WELL[ \t]*\.([^:\r\n]*):')
+LAS_HEADER_BYTES = 65536
 
-for filename in las_files[:50]:
-    filepath = os.path.join(las_dir, filename)
-    
+def _extract_wells(filepath):
+    """Return the set of WELL names declared in a LAS file"""
+    wells = set()
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        with open(filepath, 'rb') as f:
+            header = f.read(LAS_HEADER_BYTES)
         
-        for line in content.split('\n'):
-            if 'WELL' in line.upper() and '.' in line:
-                well = line.split('.')[1].split(':')[0].strip()
-                wells_found.add(well)
+        # Header only: stop at the ~A (ASCII log data) section
+        data_start = header.find(b'\n~A')
+        if data_start != -1:
+            header = header[:data_start]
+        
+        upper = header.upper()
+        if b'WELL' not in upper:
+            return wells
+        
+        # Offsets are shared with the original header, which keeps the name's case
+        for match in WELL_LINE_RE.finditer(upper):
+            start, end = match.span(1)
+            wells.add(header[start:end].strip().decode('utf-8', 'replace'))
     except:
         pass
+    return wells
+
+wells_found = set()
+total_depth = 0
+
+las_paths = [os.path.join(las_dir, filename) for filename in las_files[:50]]
+
+# Threads rather than processes: the work is file I/O, and this script runs
+# at module level so a spawned worker would re-execute every test
+for wells in io_pool.map(_extract_wells, las_paths):
+    wells_found |= wells
 
 test_results["las_parsing"] = {
     "files_parsed": 50,
@@ -96,13 +157,13 @@ print("=" * 70)
 print()
 
 try:
-    with open('risk_scores.json') as f:
-        risk_data = json.load(f)
+    risk_data = json_inputs['risk_scores.json'].result()
     
-    critical = sum(1 for v in risk_data.values() if v.get('level') == 'CRITICAL')
-    high = sum(1 for v in risk_data.values() if v.get('level') == 'HIGH')
-    medium = sum(1 for v in risk_data.values() if v.get('level') == 'MEDIUM')
-    low = sum(1 for v in risk_data.values() if v.get('level') == 'LOW')
+    levels = Counter(v.get('level') for v in risk_data.values())
+    critical = levels['CRITICAL']
+    high = levels['HIGH']
+    medium = levels['MEDIUM']
+    low = levels['LOW']
     
     test_results["risk_scoring"] = {
         "total_wells": len(risk_data),
@@ -134,8 +195,7 @@ print("=" * 70)
 print()
 
 try:
-    with open('fast_results.json') as f:
-        fast_data = json.load(f)
+    fast_data = json_inputs['fast_results.json'].result()
     
     ghost_iron = [r for r in fast_data if r.get('ghost_iron')]
     
@@ -167,22 +227,22 @@ print("=" * 70)
 print()
 
 try:
-    with open('vision_three_4d_export.json') as f:
-        model_4d = json.load(f)
+    model_4d = json_inputs['vision_three_4d_export.json'].result()
     
     objects = model_4d.get('objects', [])
     spine = model_4d.get('well', {}).get('spine', {})
     
     # Check John's requirements
-    has_geometry = all(
-        'maxOD' in obj.get('geometry', {}) for obj in objects
-    )
-    has_relationships = all(
-        'parentId' in obj.get('relationships', {}) for obj in objects
-    )
-    has_lifecycle = all(
-        len(obj.get('lifecycle', [])) > 0 for obj in objects
-    )
+    has_geometry = has_relationships = has_lifecycle = True
+    for obj in objects:
+        if has_geometry and 'maxOD' not in obj.get('geometry', {}):
+            has_geometry = False
+        if has_relationships and 'parentId' not in obj.get('relationships', {}):
+            has_relationships = False
+        if has_lifecycle and not obj.get('lifecycle'):
+            has_lifecycle = False
+        if not (has_geometry or has_relationships or has_lifecycle):
+            break
     
     test_results["4d_model"] = {
         "objects": len(objects),
@@ -214,8 +274,7 @@ print("=" * 70)
 print()
 
 try:
-    with open('decay_assessment.json') as f:
-        decay = json.load(f)
+    decay = json_inputs['decay_assessment.json'].result()
     
     test_results["decay_model"] = decay
     
@@ -241,8 +300,7 @@ print("=" * 70)
 print()
 
 try:
-    with open('downtime_scorecard.json') as f:
-        scorecard = json.load(f)
+    scorecard = json_inputs['downtime_scorecard.json'].result()
     
     companies = scorecard.get('company_scorecards', [])
     equipment = scorecard.get('equipment_scorecards', [])
@@ -319,6 +377,7 @@ print()
 # FINAL SUMMARY
 # ==============================================================================
 
+io_pool.shutdown()
 elapsed = time.time() - start_time
 
 print()
@@ -361,8 +420,12 @@ test_results["summary"] = {
     "tests_total": total_tests
 }
 
-with open("END_TO_END_TEST_RESULTS.json", "w") as f:
-    json.dump(test_results, f, indent=2, default=str)
+if orjson is not None:
+    with open("END_TO_END_TEST_RESULTS.json", "wb") as f:
+        f.write(orjson.dumps(test_results, option=orjson.OPT_INDENT_2))
+else:
+    with open("END_TO_END_TEST_RESULTS.json", "w") as f:
+        json.dump(test_results, f, indent=2)
 
 print("=" * 70)
 print("📁 SAVED: END_TO_END_TEST_RESULTS.json")
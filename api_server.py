@@ -2,17 +2,29 @@
 """
 WellTegra Brahan Forensic Engine - REST API
 All-in-one API server with real-time updates
+
+Run under gunicorn in production (see wsgi.py); `python api_server.py`
+starts the Flask development server.
 """
 
-from flask import Flask, jsonify, request
-from flask_cors import CORS
 import json
 import os
+import time
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
+from functools import lru_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
 
-app = Flask(__name__)
-CORS(app)
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj)
 
 # ======================================================================
 # LOAD DATA
@@ -20,14 +32,7 @@ CORS(app)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def load_json(filename):
-    try:
-        with open(os.path.join(BASE_DIR, filename)) as f:
-            return json.load(f)
-    except:
-        return {}
-
-# Load all data files
+# Data files, keyed by the name the endpoints use
 data_files = {
     "risk_scores": "risk_scores.json",
     "fraud": "fraud_detection_report.json",
@@ -39,54 +44,69 @@ data_files = {
     "audit": "audit_trail.json"
 }
 
-data = {}
-for key, filename in data_files.items():
-    data[key] = load_json(filename)
+@lru_cache(maxsize=32)
+def _load_json(path, mtime_ns):
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
-# ======================================================================
-# API ENDPOINTS
-# ======================================================================
+def load_json(filename):
+    """Load a data file, re-parsing only when its mtime changes"""
+    path = os.path.join(BASE_DIR, filename)
+    try:
+        return _load_json(path, os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return {}
+
+def get_data(key):
+    return load_json(data_files[key])
 
-@app.route('/', methods=['GET'])
-def index():
-    return jsonify({
-        "name": "WellTegra Brahan Forensic API",
-        "version": "3.0",
-        "endpoints": [
-            "GET /api/summary",
-            "GET /api/wells",
-            "GET /api/wells/<well_id>",
-            "GET /api/fraud",
-            "GET /api/ghost-fish",
-            "GET /api/risk-scores",
-            "GET /api/compliance",
-            "GET /api/predictions",
-            "GET /api/audit",
-            "POST /api/scan"
-        ]
-    })
-
-@app.route('/api/summary', methods=['GET'])
-def get_summary():
-    risk = data.get("risk_scores", {})
-    
-    return jsonify({
-        "total_wells": len(risk),
-        "critical": sum(1 for v in risk.values() if v.get("level") == "CRITICAL"),
-        "high_risk": sum(1 for v in risk.values() if v.get("level") == "HIGH"),
-        "medium_risk": sum(1 for v in risk.values() if v.get("level") == "MEDIUM"),
-        "low_risk": sum(1 for v in risk.values() if v.get("level") == "LOW"),
-        "compliance_score": data.get("compliance", {}).get("score", 0),
-        "timestamp": datetime.now().isoformat()
-    })
-
-@app.route('/api/wells', methods=['GET'])
-def get_wells():
-    wells = data.get("wells", {}).get("wells", {})
-    risk = data.get("risk_scores", {})
-    
+def _data_mtime(key):
+    try:
+        return os.stat(os.path.join(BASE_DIR, data_files[key])).st_mtime_ns
+    except OSError:
+        return None
+
+# name -> (source mtimes, value)
+_derived = {}
+
+def get_derived(name, keys, build):
+    """Value built from the data files in keys, rebuilt only when one changes"""
+    stamp = tuple(_data_mtime(key) for key in keys)
+    cached = _derived.get(name)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, build(*(get_data(key) for key in keys)))
+        _derived[name] = cached
+    return cached[1]
+
+def get_response_body(name, key, select=None):
+    """Encoded JSON for an endpoint, re-encoded only when its data file changes"""
+    return get_derived(name, (key,), lambda data: _json_dumps(select(data) if select else data))
+
+def preload_data():
+    """Parse every data file up front, e.g. in a gunicorn --preload master"""
+    for key in data_files:
+        get_data(key)
+
+# Timestamps are formatted at most once per second
+@lru_cache(maxsize=2)
+def _iso_timestamp(second):
+    return datetime.fromtimestamp(second).isoformat()
+
+@lru_cache(maxsize=2)
+def _scan_stamp(second):
+    return datetime.fromtimestamp(second).strftime('%Y%m%d-%H%M%S')
+
+def get_well_table():
+    """The well_inventory "wells" table, resolved once per file revision"""
+    return get_derived("wells", ("wells",), lambda inventory: inventory.get("wells", {}))
+
+def get_compliance_score():
+    return get_derived("compliance_score", ("compliance",), lambda compliance: compliance.get("score", 0))
+
+def encode_well_list(inventory, risk):
+    """/api/wells body: each well joined with its risk score"""
     result = []
-    for well_name, well_data in wells.items():
+    for well_name, well_data in inventory.get("wells", {}).items():
         well_risk = risk.get(well_name, {})
         result.append({
             "name": well_name,
@@ -96,65 +116,135 @@ def get_wells():
             "risk_level": well_risk.get("level", "LOW"),
             "factors": well_risk.get("factors", [])
         })
-    
-    return jsonify(result)
-
-@app.route('/api/wells/<well_id>', methods=['GET'])
-def get_well(well_id):
-    wells = data.get("wells", {}).get("wells", {})
-    risk = data.get("risk_scores", {})
-    fraud = data.get("fraud", {}).get("details", [])
-    
-    well_data = wells.get(well_id, {})
-    well_risk = risk.get(well_id, {})
-    well_fraud = [f for f in fraud if f.get("well") == well_id]
-    
-    return jsonify({
-        "well_id": well_id,
-        "details": well_data,
-        "risk": well_risk,
-        "fraud_flags": well_fraud
-    })
-
-@app.route('/api/fraud', methods=['GET'])
-def get_fraud():
-    fraud = data.get("fraud", {})
-    return jsonify({
-        "total": fraud.get("files_flagged", 0),
-        "critical": fraud.get("critical", 0),
-        "high": fraud.get("high", 0),
-        "details": fraud.get("details", [])[:50]
-    })
-
-@app.route('/api/ghost-fish', methods=['GET'])
-def get_ghost_fish():
-    gf = data.get("ghost_fish", {})
-    return jsonify(gf.get("ghost_fish", []))
-
-@app.route('/api/risk-scores', methods=['GET'])
-def get_risk_scores():
-    return jsonify(data.get("risk_scores", {}))
-
-@app.route('/api/compliance', methods=['GET'])
-def get_compliance():
-    return jsonify(data.get("compliance", {}))
-
-@app.route('/api/predictions', methods=['GET'])
-def get_predictions():
-    return jsonify(data.get("predictions", {}))
-
-@app.route('/api/audit', methods=['GET'])
-def get_audit():
-    return jsonify(data.get("audit", {}))
-
-@app.route('/api/scan', methods=['POST'])
-def trigger_scan():
-    # In production, this would trigger a new scan
-    return jsonify({
-        "status": "started",
-        "scan_id": f"SCAN-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-        "message": "Scan initiated"
-    })
+    return _json_dumps(result)
+
+def count_risk_levels(risk):
+    return Counter(v.get("level") for v in risk.values())
+
+def index_fraud_by_well(fraud):
+    by_well = defaultdict(list)
+    for flag in fraud.get("details", []):
+        by_well[flag.get("well")].append(flag)
+    return by_well
+
+# ======================================================================
+# API ENDPOINTS
+# ======================================================================
+
+def create_app():
+    """Build the Flask app; flask is only imported when a server is wanted"""
+    from flask import Flask
+    from flask_cors import CORS
+
+    app = Flask(__name__)
+    CORS(app)
+
+    def ojsonify(obj):
+        """jsonify() replacement that encodes with orjson when available"""
+        return json_response(_json_dumps(obj))
+
+    def json_response(body):
+        return app.response_class(body, mimetype='application/json')
+
+    @app.route('/', methods=['GET'])
+    def index():
+        return ojsonify({
+            "name": "WellTegra Brahan Forensic API",
+            "version": "3.0",
+            "endpoints": [
+                "GET /api/summary",
+                "GET /api/wells",
+                "GET /api/wells/<well_id>",
+                "GET /api/fraud",
+                "GET /api/ghost-fish",
+                "GET /api/risk-scores",
+                "GET /api/compliance",
+                "GET /api/predictions",
+                "GET /api/audit",
+                "POST /api/scan"
+            ]
+        })
+
+    @app.route('/api/summary', methods=['GET'])
+    def get_summary():
+        risk = get_data("risk_scores")
+        levels = get_derived("risk_levels", ("risk_scores",), count_risk_levels)
+
+        return ojsonify({
+            "total_wells": len(risk),
+            "critical": levels["CRITICAL"],
+            "high_risk": levels["HIGH"],
+            "medium_risk": levels["MEDIUM"],
+            "low_risk": levels["LOW"],
+            "compliance_score": get_compliance_score(),
+            "timestamp": _iso_timestamp(int(time.time()))
+        })
+
+    @app.route('/api/wells', methods=['GET'])
+    def get_wells():
+        return json_response(
+            get_derived("wells_body", ("wells", "risk_scores"), encode_well_list)
+        )
+
+    @app.route('/api/wells/<well_id>', methods=['GET'])
+    def get_well(well_id):
+        wells = get_well_table()
+        risk = get_data("risk_scores")
+        fraud_by_well = get_derived("fraud_by_well", ("fraud",), index_fraud_by_well)
+
+        well_data = wells.get(well_id, {})
+        well_risk = risk.get(well_id, {})
+        well_fraud = fraud_by_well.get(well_id, [])
+
+        return ojsonify({
+            "well_id": well_id,
+            "details": well_data,
+            "risk": well_risk,
+            "fraud_flags": well_fraud
+        })
+
+    @app.route('/api/fraud', methods=['GET'])
+    def get_fraud():
+        fraud = get_data("fraud")
+        return ojsonify({
+            "total": fraud.get("files_flagged", 0),
+            "critical": fraud.get("critical", 0),
+            "high": fraud.get("high", 0),
+            "details": fraud.get("details", [])[:50]
+        })
+
+    @app.route('/api/ghost-fish', methods=['GET'])
+    def get_ghost_fish():
+        return json_response(get_response_body(
+            "ghost_fish_body", "ghost_fish", lambda gf: gf.get("ghost_fish", [])
+        ))
+
+    @app.route('/api/risk-scores', methods=['GET'])
+    def get_risk_scores():
+        return json_response(get_response_body("risk_scores_body", "risk_scores"))
+
+    @app.route('/api/compliance', methods=['GET'])
+    def get_compliance():
+        return json_response(get_response_body("compliance_body", "compliance"))
+
+    @app.route('/api/predictions', methods=['GET'])
+    def get_predictions():
+        return json_response(get_response_body("predictions_body", "predictions"))
+
+    @app.route('/api/audit', methods=['GET'])
+    def get_audit():
+        return json_response(get_response_body("audit_body", "audit"))
+
+    @app.route('/api/scan', methods=['POST'])
+    def trigger_scan():
+        # In production, this would trigger a new scan
+        return ojsonify({
+            "status": "started",
+            "scan_id": f"SCAN-{_scan_stamp(int(time.time()))}",
+            "message": "Scan initiated"
+        })
+
+    return app
 
 # ======================================================================
 # RUN SERVER
@@ -175,4 +265,4 @@ if __name__ == '__main__':
     print("  GET /api/risk-scores")
     print("  GET /api/compliance")
     print()
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    create_app().run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
@@ -14,25 +14,46 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WELLABUILD_DIR = '/home/brahan_welltegra/wellabuild/wellabuild'
+WELLARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (build dir mtimes) -> report file written for them
+_REPORT_CACHE = {}
+
+def _build_dirs_signature():
+    signature = []
+    for build_dir in (WELLABUILD_DIR, WELLARK_DIR):
+        try:
+            signature.append(os.stat(build_dir).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+def _scan_build_dir(build_dir, key_modules):
+    """Describe a build directory with a single directory read"""
+    with os.scandir(build_dir) as it:
+        file_names = [entry.name for entry in it if entry.is_file()]
+    present = set(file_names)
+
+    return {
+        'path': build_dir,
+        'exists': True,
+        'modules': [module for module in key_modules if module in present],
+        'python_files': [name for name in file_names if name.endswith('.py')]
+    }
+
 def get_build_info():
     """Get information about both builds"""
     builds = {}
 
     # WellABUILD info
-    wellabuild_dir = '/home/brahan_welltegra/wellabuild/wellabuild'
-    if os.path.exists(wellabuild_dir):
-        builds['wellabuild'] = {
-            'path': wellabuild_dir,
-            'exists': True,
-            'modules': [],
-            'python_files': []
-        }
-
-        # List Python files
-        for file in os.listdir(wellabuild_dir):
-            if file.endswith('.py'):
-                builds['wellabuild']['python_files'].append(file)
-
+    wellabuild_dir = WELLABUILD_DIR
+    if os.path.isdir(wellabuild_dir):
         # Check for key modules
         key_modules = [
             'wellabuild_sdk.py',
@@ -40,36 +61,18 @@ def get_build_info():
             'material_audit.py',
             'run_full_audit.py'
         ]
-
-        for module in key_modules:
-            if os.path.exists(os.path.join(wellabuild_dir, module)):
-                builds['wellabuild']['modules'].append(module)
+        builds['wellabuild'] = _scan_build_dir(wellabuild_dir, key_modules)
 
     # WellArk info (treating current directory as WellArk)
-    wellark_dir = os.path.dirname(os.path.abspath(__file__))
-    if os.path.exists(wellark_dir):
-        builds['wellark'] = {
-            'path': wellark_dir,
-            'exists': True,
-            'modules': [],
-            'python_files': []
-        }
-
-        # List Python files
-        for file in os.listdir(wellark_dir):
-            if file.endswith('.py'):
-                builds['wellark']['python_files'].append(file)
-
+    wellark_dir = WELLARK_DIR
+    if os.path.isdir(wellark_dir):
         # Check for integration scripts
         integration_modules = [
             'UNIFIED_INTEGRATION.py',
             'run_unified_analysis.py',
             'simple_runner.py'
         ]
-
-        for module in integration_modules:
-            if os.path.exists(os.path.join(wellark_dir, module)):
-                builds['wellark']['modules'].append(module)
+        builds['wellark'] = _scan_build_dir(wellark_dir, integration_modules)
 
     return builds
 
@@ -178,6 +181,15 @@ def create_integration_report():
     """Create a comprehensive integration report"""
     print("🔍 Analyzing Build Integration...")
 
+    output_dir = os.path.join(os.path.dirname(__file__), "integration_reports")
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Reuse the last report while neither build directory has changed
+    signature = _build_dirs_signature()
+    cached_report = _REPORT_CACHE.get(signature)
+    if cached_report and os.path.exists(cached_report):
+        return cached_report
+
     # Get build information
     builds = get_build_info()
 
@@ -204,15 +216,17 @@ def create_integration_report():
         report['recommendations'].append("Check build module availability")
 
     # Save report
-    output_dir = os.path.join(os.path.dirname(__file__), "integration_reports")
-    os.makedirs(output_dir, exist_ok=True)
-
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = os.path.join(output_dir, f"integration_report_{timestamp}.json")
 
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2, default=str)
+    if orjson is not None:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
 
+    _REPORT_CACHE[signature] = report_file
     return report_file
 
 def display_summary(report):
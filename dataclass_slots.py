@@ -0,0 +1,30 @@
+"""
+Slotted dataclasses - explicit __slots__ for Python 3.8+
+
+dataclass(slots=True) only exists from Python 3.10. Fields with defaults
+cannot be listed in a class body's __slots__ either, because the default
+becomes a class attribute. slotted() rebuilds the finished dataclass with
+__slots__ instead, the same way dataclass(slots=True) does.
+
+    @slotted
+    @dataclass
+    class Record:
+        name: str = ""
+"""
+
+from dataclasses import fields
+
+
+def slotted(cls):
+    """Return a copy of dataclass cls that stores its fields in __slots__"""
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # Defaults are already bound into the generated __init__
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
@@ -4,24 +4,32 @@ Fixed Decay Model - Correct remaining life calculation
 """
 
 import json
+import math
+from bisect import bisect_left
 from datetime import datetime
+from enum import IntEnum
 
-# Corrosion rates (mm/year)
-CORROSION_RATES = {
-    "SWEET_PRODUCTION": 0.2,
-    "SOUR_PRODUCTION": 0.5,
-    "SEAWATER": 0.15,
-    "BRINE": 0.3,
-}
+class Environment(IntEnum):
+    SWEET_PRODUCTION = 0
+    SOUR_PRODUCTION = 1
+    SEAWATER = 2
+    BRINE = 3
+
+# Corrosion rates (mm/year), indexed by Environment
+CORROSION_RATES = (0.2, 0.5, 0.15, 0.3)
+CORROSION_RATES_IN = tuple(rate_mm / 25.4 for rate_mm in CORROSION_RATES)  # inches/year
+
+# Wall loss % above each threshold moves status up one level
+WALL_LOSS_THRESHOLDS = (15, 30, 50)
+WALL_LOSS_STATUS = ("ACCEPTABLE", "MODERATE", "SEVERE", "CRITICAL")
 
 def calculate_decay(initial_wall, install_year, environment, target_year):
     """Calculate decay at target year"""
     
     years = target_year - install_year
     
-    # Get corrosion rate
-    rate_mm = CORROSION_RATES.get(environment, 0.2)
-    rate_in = rate_mm / 25.4  # Convert to inches/year
+    # Get corrosion rate (inches/year)
+    rate_in = CORROSION_RATES_IN[environment]
     
     # Calculate wall loss
     wall_loss = rate_in * years
@@ -29,39 +37,53 @@ def calculate_decay(initial_wall, install_year, environment, target_year):
     
     return remaining_wall, wall_loss
 
-def calculate_remaining_life(current_wall, min_wall_pct, environment):
-    """Calculate remaining life from current state"""
+def calculate_decay_series(initial_wall, install_year, environment, target_years):
+    """Calculate decay for a sequence of target years with one rate lookup"""
+    
+    rate_in = CORROSION_RATES_IN[environment]
+    
+    wall_losses = [rate_in * (year - install_year) for year in target_years]
+    remaining_walls = [max(0, initial_wall - loss) for loss in wall_losses]
+    
+    return remaining_walls, wall_losses
+
+def calculate_remaining_life(current_wall, initial_wall, min_wall_pct, rate_in):
+    """Calculate remaining life from current state (rate_in in inches/year)"""
     
     min_wall = current_wall * min_wall_pct
     
     if current_wall <= min_wall:
         return 0, "FAILED"
     
-    rate_mm = CORROSION_RATES.get(environment, 0.2)
-    rate_in = rate_mm / 25.4
-    
     remaining_thickness = current_wall - min_wall
     remaining_years = remaining_thickness / rate_in if rate_in > 0 else 999
     
     # Status
     wall_loss_pct = (1 - current_wall / initial_wall) * 100 if initial_wall > 0 else 0
     
-    if wall_loss_pct > 50:
-        status = "CRITICAL"
-    elif wall_loss_pct > 30:
-        status = "SEVERE"
-    elif wall_loss_pct > 15:
-        status = "MODERATE"
-    else:
-        status = "ACCEPTABLE"
+    status = WALL_LOSS_STATUS[bisect_left(WALL_LOSS_THRESHOLDS, wall_loss_pct)]
     
     return remaining_years, status
 
+def calculate_failure_year(initial_wall, install_year, min_wall_pct, rate_in, horizon_year=2100):
+    """First whole year the wall reaches the failure minimum (None if not before horizon_year)"""
+    
+    # Linear corrosion: solve initial_wall - rate_in * years <= initial_wall * min_wall_pct
+    allowable_loss = initial_wall * (1 - min_wall_pct)
+    if allowable_loss <= 0:
+        return install_year
+    if rate_in <= 0:
+        return None
+    
+    failure_year = install_year + math.ceil(allowable_loss / rate_in)
+    return failure_year if failure_year < horizon_year else None
+
 # Parameters
 initial_wall = 0.470  # inches
 install_year = 1990
-environment = "SWEET_PRODUCTION"
+environment = Environment.SWEET_PRODUCTION
 min_wall_pct = 0.5  # 50% minimum before failure
+rate_in = CORROSION_RATES_IN[environment]
 
 print()
 print("=" * 70)
@@ -71,7 +93,7 @@ print()
 
 print(f"Initial wall thickness: {initial_wall} inches")
 print(f"Install year: {install_year}")
-print(f"Environment: {environment}")
+print(f"Environment: {environment.name}")
 print(f"Corrosion rate: {CORROSION_RATES[environment]} mm/year")
 print(f"Minimum wall (failure): {initial_wall * min_wall_pct:.3f} inches (50%)")
 print()
@@ -84,29 +106,28 @@ print()
 print(f"{'Year':<8} {'Wall(in)':<12} {'Loss%':<10} {'Remaining':<12} {'Status':<12}")
 print("-" * 60)
 
-for year in range(1990, 2055, 5):
-    wall, loss = calculate_decay(initial_wall, install_year, environment, year)
-    
+timeline_years = range(1990, 2055, 5)
+timeline_walls, timeline_losses = calculate_decay_series(initial_wall, install_year, environment, timeline_years)
+
+timeline_rows = []
+for year, wall, loss in zip(timeline_years, timeline_walls, timeline_losses):
     # Calculate remaining life from THIS point
     if wall > 0:
-        remaining_life, status = calculate_remaining_life(wall, min_wall_pct, environment)
+        remaining_life, status = calculate_remaining_life(wall, initial_wall, min_wall_pct, rate_in)
     else:
         remaining_life = 0
         status = "FAILED"
     
     loss_pct = (loss / initial_wall) * 100 if initial_wall > 0 else 100
     
-    print(f"{year:<8} {wall:<12.3f} {loss_pct:<10.1f} {remaining_life:<12.1f} {status:<12}")
+    timeline_rows.append(f"{year:<8} {wall:<12.3f} {loss_pct:<10.1f} {remaining_life:<12.1f} {status:<12}")
+
+print("\n".join(timeline_rows))
 
 print()
 
 # Find year of failure
-failure_year = None
-for year in range(install_year, 2100):
-    wall, _ = calculate_decay(initial_wall, install_year, environment, year)
-    if wall <= initial_wall * min_wall_pct:
-        failure_year = year
-        break
+failure_year = calculate_failure_year(initial_wall, install_year, min_wall_pct, rate_in)
 
 if failure_year:
     print(f"⚠️ PREDICTED FAILURE YEAR: {failure_year}")
@@ -116,7 +137,7 @@ if failure_year:
 # Assessment
 current_year = 2024
 current_wall, _ = calculate_decay(initial_wall, install_year, environment, current_year)
-remaining, status = calculate_remaining_life(current_wall, min_wall_pct, environment)
+remaining, status = calculate_remaining_life(current_wall, initial_wall, min_wall_pct, rate_in)
 
 print("=" * 70)
 print("CURRENT ASSESSMENT (2024)")
@@ -132,7 +153,7 @@ print()
 output = {
     "initial_wall_inches": initial_wall,
     "install_year": install_year,
-    "environment": environment,
+    "environment": environment.name,
     "corrosion_rate_mm_per_year": CORROSION_RATES[environment],
     "current_wall_2024": round(current_wall, 3),
     "predicted_failure_year": failure_year,
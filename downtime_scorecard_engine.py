@@ -11,11 +11,19 @@
 
 import json
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from collections import defaultdict
-import uuid
+import secrets
+from bisect import bisect_right
+from itertools import chain
+
+from dataclass_slots import slotted
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ==============================================================================
 # ENUMS
@@ -62,10 +70,15 @@ class Severity(Enum):
 # DATA CLASSES - Intervention Run Record
 # ==============================================================================
 
+def _short_id() -> str:
+    """8-hex-character record ID"""
+    return secrets.token_hex(4)
+
+@slotted
 @dataclass
 class DowntimeEvent:
     """A single downtime event during intervention"""
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    event_id: str = field(default_factory=_short_id)
     timestamp_start: str = ""
     timestamp_end: str = ""
     duration_minutes: float = 0.0
@@ -76,6 +89,15 @@ class DowntimeEvent:
     equipment_serial: str = ""
     vessel_manifest_ref: str = ""
     
+@slotted
+@dataclass
+class ServiceCompany:
+    """Service company or contractor on a run"""
+    name: str = "UNKNOWN"
+    role: str = ""
+    crew_ids: List[str] = field(default_factory=list)
+
+@slotted
 @dataclass
 class BarrierTest:
     """Barrier test between runs"""
@@ -85,6 +107,7 @@ class BarrierTest:
     result: str = ""
     comments: str = ""
 
+@slotted
 @dataclass
 class EquipmentCertification:
     """Equipment certification status"""
@@ -95,6 +118,7 @@ class EquipmentCertification:
     last_inspection_date: str = ""
     non_conformances: List[str] = field(default_factory=list)
 
+@slotted
 @dataclass
 class PersonnelRole:
     """Personnel competence record"""
@@ -106,6 +130,7 @@ class PersonnelRole:
     expiry_date: str = ""
     notes: str = ""
 
+@slotted
 @dataclass
 class SIMOPSConflict:
     """SIMOPS conflict record"""
@@ -115,14 +140,19 @@ class SIMOPSConflict:
     description: str = ""
     mitigations: List[str] = field(default_factory=list)
 
+@slotted
 @dataclass
 class InterventionRunRecord:
     """
     Complete Intervention Run Record
     Encodes all data for a single intervention operation
+
+    List-valued fields default to a shared empty tuple, promoted to a
+    list on first use: add items with append_to(), or call _ensure()
+    before mutating a field in place.
     """
     # Run Identity
-    run_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    run_id: str = field(default_factory=_short_id)
     well_id: str = ""
     uwi: str = ""
     operation_type: str = ""
@@ -130,15 +160,15 @@ class InterventionRunRecord:
     date_end: str = ""
     
     # People & Companies
-    service_companies: List[Dict] = field(default_factory=list)
-    contractors: List[Dict] = field(default_factory=list)
+    service_companies: Sequence[ServiceCompany] = ()
+    contractors: Sequence[ServiceCompany] = ()
     operator_team: Dict = field(default_factory=dict)
     
     # Equipment
-    wireline_units: List[Dict] = field(default_factory=list)
-    pressure_control_equipment: List[Dict] = field(default_factory=list)
-    powerpacks_panels: List[Dict] = field(default_factory=list)
-    lifting_equipment: List[Dict] = field(default_factory=list)
+    wireline_units: Sequence[Dict] = ()
+    pressure_control_equipment: Sequence[Dict] = ()
+    powerpacks_panels: Sequence[Dict] = ()
+    lifting_equipment: Sequence[Dict] = ()
     
     # Rig-up Constraints
     space_constraints: str = ""
@@ -146,13 +176,13 @@ class InterventionRunRecord:
     layout_notes: str = ""
     
     # Barriers
-    barriers_prior_to_rigup: List[Dict] = field(default_factory=list)
-    barrier_tests: List[BarrierTest] = field(default_factory=list)
+    barriers_prior_to_rigup: Sequence[Dict] = ()
+    barrier_tests: Sequence[BarrierTest] = ()
     double_block_type: str = ""
     double_block_in_use: bool = False
     
     # Downtime Events
-    downtime_events: List[DowntimeEvent] = field(default_factory=list)
+    downtime_events: Sequence[DowntimeEvent] = ()
     
     # Safety & Compliance
     arrival_safety_checks: Dict = field(default_factory=dict)
@@ -165,16 +195,124 @@ class InterventionRunRecord:
     
     # SIMOPS
     simops_active: bool = False
-    simops_operations: List[Dict] = field(default_factory=list)
-    simops_conflicts: List[SIMOPSConflict] = field(default_factory=list)
+    simops_operations: Sequence[Dict] = ()
+    simops_conflicts: Sequence[SIMOPSConflict] = ()
     
     # Emergency & Incidents
-    incidents: List[Dict] = field(default_factory=list)
-    waiting_events: List[Dict] = field(default_factory=list)
+    incidents: Sequence[Dict] = ()
+    waiting_events: Sequence[Dict] = ()
     
     # Metadata
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     metadata: Dict = field(default_factory=dict)
+    
+    def _ensure(self, name: str) -> List:
+        """List held in field name, promoting the shared empty default first"""
+        value = getattr(self, name)
+        if not isinstance(value, list):
+            value = list(value)
+            setattr(self, name, value)
+        return value
+    
+    def append_to(self, name: str, item: Any):
+        """Append item to list field name, e.g. run.append_to("barrier_tests", test)"""
+        self._ensure(name).append(item)
+
+# ==============================================================================
+# DATA CLASSES - Scorecard Accumulators
+# ==============================================================================
+
+# Position of each FailureCause value in CompanyStats.cause_counts
+_CAUSE_INDEX = {cause.value: i for i, cause in enumerate(FailureCause)}
+_NON_COMPLIANT_IX = _CAUSE_INDEX[FailureCause.NON_COMPLIANT_ON_ARRIVAL.value]
+_EQUIPMENT_FAILURE_IX = _CAUSE_INDEX[FailureCause.EQUIPMENT_FAILURE.value]
+_HUMAN_ERROR_IX = _CAUSE_INDEX[FailureCause.HUMAN_ERROR.value]
+
+@slotted
+@dataclass
+class CompanyStats:
+    """Running totals for one service company or contractor"""
+    total_runs: int = 0
+    downtime_events_count: int = 0
+    downtime_minutes_total: float = 0
+    cause_counts: List[int] = field(default_factory=lambda: [0] * len(_CAUSE_INDEX))
+    other_causes: Dict[str, int] = field(default_factory=dict)
+    incidents_count: int = 0
+    barrier_test_failures: int = 0
+    simops_conflicts: int = 0
+    
+    @property
+    def events_by_cause(self) -> Dict[str, int]:
+        """Event counts keyed by failure cause string"""
+        counts = {cause: n for cause, n in zip(_CAUSE_INDEX, self.cause_counts) if n}
+        counts.update(self.other_causes)
+        return counts
+    
+    @property
+    def non_compliant_on_arrival_count(self) -> int:
+        return self.cause_counts[_NON_COMPLIANT_IX]
+    
+    @property
+    def equipment_failures(self) -> int:
+        return self.cause_counts[_EQUIPMENT_FAILURE_IX]
+    
+    @property
+    def human_errors(self) -> int:
+        return self.cause_counts[_HUMAN_ERROR_IX]
+
+@slotted
+@dataclass
+class EquipmentStats:
+    """Running totals for one equipment item"""
+    times_used: int = 0
+    failures: int = 0
+    downtime_caused_minutes: float = 0
+    non_conformances: int = 0
+    companies_involved: set = field(default_factory=set)
+
+# ==============================================================================
+# SCORING
+# ==============================================================================
+
+def _downtime_score(total_runs: int, downtime_total: float) -> float:
+    """Downtime score (0-100, higher is better) from run count and total minutes"""
+    if total_runs == 0:
+        return 0.0
+    
+    # Average downtime per run
+    avg_downtime = downtime_total / total_runs
+    
+    # Score calculation (less downtime = higher score)
+    # 0 min avg = 100, 120 min avg = 50, 240+ min avg = 0
+    if avg_downtime == 0:
+        return 100.0
+    elif avg_downtime >= 240:
+        return 0.0
+    else:
+        return max(0, 100 - (avg_downtime / 2.4))
+
+def _safety_score(nca: int, he: int, inc: int, btf: int, simops: int) -> float:
+    """Safety compliance score (0-100, higher is better) from issue counts"""
+    score = 100.0 - nca * 15 - he * 10 - inc * 25 - btf * 10 - simops * 5
+    return max(0, min(100, score))
+
+def _reliability_key(scorecard: Dict) -> float:
+    """Sort key for scorecards; NO_DATA entries sort as 0"""
+    return scorecard.get("reliability_score") or 0
+
+def _descending_scores(ranked: List[Dict]) -> List[float]:
+    """Negated scores of a list sorted high-to-low, i.e. ascending for bisect"""
+    return [-_reliability_key(scorecard) for scorecard in ranked]
+
+def _below(ranked: List[Dict], scores: List[float], threshold: float, limit: int = 5) -> List[Dict]:
+    """First `limit` scorecards under threshold from a list sorted high-to-low"""
+    start = bisect_right(scores, -threshold)
+    return ranked[start:start + limit]
+
+def _at_least(ranked: List[Dict], scores: List[float], threshold: float, limit: int = 5) -> List[Dict]:
+    """First `limit` scorecards at or above threshold from a list sorted high-to-low"""
+    end = bisect_right(scores, -threshold)
+    return ranked[:min(end, limit)]
 
 # ==============================================================================
 # SCORECARD CALCULATOR
@@ -188,26 +326,52 @@ class DowntimeScorecardEngine:
     
     def __init__(self):
         self.runs: List[InterventionRunRecord] = []
-        self.company_stats = defaultdict(lambda: {
-            "total_runs": 0,
-            "downtime_events_count": 0,
-            "downtime_minutes_total": 0,
-            "events_by_cause": defaultdict(int),
-            "non_compliant_on_arrival_count": 0,
-            "equipment_failures": 0,
-            "human_errors": 0,
-            "incidents_count": 0,
-            "barrier_test_failures": 0,
-            "simops_conflicts": 0
-        })
-        
-        self.equipment_stats = defaultdict(lambda: {
-            "times_used": 0,
-            "failures": 0,
-            "downtime_caused_minutes": 0,
-            "non_conformances": 0,
-            "companies_involved": set()
-        })
+        self.company_stats: Dict[str, CompanyStats] = {}
+        self.equipment_stats: Dict[str, EquipmentStats] = {}
+        # Runs folded into the stats by an earlier engine (see load())
+        self.prior_runs = 0
+    
+    def _company(self, name: str) -> CompanyStats:
+        """Stats entry for a company, created on first sight"""
+        stats = self.company_stats.get(name)
+        if stats is None:
+            stats = self.company_stats[name] = CompanyStats()
+        return stats
+    
+    def _equipment(self, equipment_id: str) -> EquipmentStats:
+        """Stats entry for an equipment item, created on first sight"""
+        stats = self.equipment_stats.get(equipment_id)
+        if stats is None:
+            stats = self.equipment_stats[equipment_id] = EquipmentStats()
+        return stats
+    
+    def save(self, path: str):
+        """Save the aggregated stats so a later engine can resume without replaying runs"""
+        state = {
+            "runs_analyzed": self.prior_runs + len(self.runs),
+            "company_stats": {name: asdict(stats) for name, stats in self.company_stats.items()},
+            "equipment_stats": {
+                equipment_id: {**asdict(stats), "companies_involved": sorted(stats.companies_involved)}
+                for equipment_id, stats in self.equipment_stats.items()
+            }
+        }
+        with open(path, "w") as f:
+            json.dump(state, f)
+    
+    @classmethod
+    def load(cls, path: str) -> "DowntimeScorecardEngine":
+        """Engine seeded with stats from save(); new runs are added on top"""
+        with open(path) as f:
+            state = json.load(f)
+        
+        engine = cls()
+        engine.prior_runs = state["runs_analyzed"]
+        for name, fields in state["company_stats"].items():
+            engine.company_stats[name] = CompanyStats(**fields)
+        for equipment_id, fields in state["equipment_stats"].items():
+            fields["companies_involved"] = set(fields["companies_involved"])
+            engine.equipment_stats[equipment_id] = EquipmentStats(**fields)
+        return engine
     
     def add_run(self, run: InterventionRunRecord):
         """Add a run record to the engine"""
@@ -218,59 +382,54 @@ class DowntimeScorecardEngine:
         """Process a run and update statistics"""
         
         # Process companies
-        companies_involved = set()
-        
         for company in run.service_companies:
-            name = company.get("name", "UNKNOWN")
-            companies_involved.add(name)
-            self.company_stats[name]["total_runs"] += 1
-        
-        for contractor in run.contractors:
-            name = contractor.get("name", "UNKNOWN")
-            companies_involved.add(name)
+            self._company(company.name).total_runs += 1
         
         # Process downtime events
         for event in run.downtime_events:
             company = event.linked_company
-            self.company_stats[company]["downtime_events_count"] += 1
-            self.company_stats[company]["downtime_minutes_total"] += event.duration_minutes
-            self.company_stats[company]["events_by_cause"][event.failure_cause] += 1
+            stats = self._company(company)
+            stats.downtime_events_count += 1
+            stats.downtime_minutes_total += event.duration_minutes
             
-            if event.failure_cause == "NON_COMPLIANT_ON_ARRIVAL":
-                self.company_stats[company]["non_compliant_on_arrival_count"] += 1
-            elif event.failure_cause == "EQUIPMENT_FAILURE":
-                self.company_stats[company]["equipment_failures"] += 1
-            elif event.failure_cause == "HUMAN_ERROR":
-                self.company_stats[company]["human_errors"] += 1
+            index = _CAUSE_INDEX.get(event.failure_cause)
+            if index is None:
+                stats.other_causes[event.failure_cause] = stats.other_causes.get(event.failure_cause, 0) + 1
+            else:
+                stats.cause_counts[index] += 1
             
             # Track equipment
             if event.linked_equipment_id:
-                self.equipment_stats[event.linked_equipment_id]["times_used"] += 1
-                self.equipment_stats[event.linked_equipment_id]["failures"] += 1
-                self.equipment_stats[event.linked_equipment_id]["downtime_caused_minutes"] += event.duration_minutes
-                self.equipment_stats[event.linked_equipment_id]["companies_involved"].add(company)
-        
-        # Process barrier tests
-        for test in run.barrier_tests:
-            if test.result == "FAIL":
-                for company in companies_involved:
-                    self.company_stats[company]["barrier_test_failures"] += 1
-        
-        # Process SIMOPS conflicts
-        for conflict in run.simops_conflicts:
-            for company in companies_involved:
-                self.company_stats[company]["simops_conflicts"] += 1
-        
-        # Process incidents
-        for incident in run.incidents:
+                equipment = self._equipment(event.linked_equipment_id)
+                equipment.times_used += 1
+                equipment.failures += 1
+                equipment.downtime_caused_minutes += event.duration_minutes
+                equipment.companies_involved.add(company)
+        
+        # Barrier test failures, SIMOPS conflicts and incidents are charged
+        # to every company involved in the run: count each kind once, then
+        # make a single pass over the companies
+        barrier_failures = sum(1 for test in run.barrier_tests if test.result == "FAIL")
+        simops_conflicts = len(run.simops_conflicts)
+        incidents = len(run.incidents)
+        
+        if barrier_failures or simops_conflicts or incidents:
+            companies_involved = frozenset(
+                company.name for company in chain(run.service_companies, run.contractors)
+            )
             for company in companies_involved:
-                self.company_stats[company]["incidents_count"] += 1
+                stats = self._company(company)
+                stats.barrier_test_failures += barrier_failures
+                stats.simops_conflicts += simops_conflicts
+                stats.incidents_count += incidents
     
     def calculate_company_score(self, company_name: str) -> Dict:
         """Calculate reliability score for a company"""
-        stats = self.company_stats[company_name]
-        
-        if stats["total_runs"] == 0:
+        return self._score_company(company_name, self.company_stats.get(company_name) or CompanyStats())
+    
+    def _score_company(self, company_name: str, stats: CompanyStats) -> Dict:
+        """Build a company scorecard from its stats entry"""
+        if stats.total_runs == 0:
             return {"company": company_name, "score": None, "status": "NO_DATA"}
         
         # Calculate scores
@@ -280,69 +439,53 @@ class DowntimeScorecardEngine:
         
         # Determine trend (simplified - would need historical data)
         trend = "STABLE"
-        if stats["incidents_count"] > 0 or stats["human_errors"] > 2:
+        if stats.incidents_count > 0 or stats.human_errors > 2:
             trend = "DEGRADING"
-        elif stats["non_compliant_on_arrival_count"] == 0 and stats["incidents_count"] == 0:
+        elif stats.non_compliant_on_arrival_count == 0 and stats.incidents_count == 0:
             trend = "IMPROVING"
         
         return {
             "company": company_name,
-            "total_runs": stats["total_runs"],
-            "downtime_events": stats["downtime_events_count"],
-            "downtime_minutes": stats["downtime_minutes_total"],
+            "total_runs": stats.total_runs,
+            "downtime_events": stats.downtime_events_count,
+            "downtime_minutes": stats.downtime_minutes_total,
             "downtime_score": round(downtime_score, 1),
             "safety_score": round(safety_score, 1),
             "reliability_score": round(reliability_score, 1),
             "reliability_trend": trend,
-            "events_by_cause": dict(stats["events_by_cause"]),
-            "non_compliant_arrivals": stats["non_compliant_on_arrival_count"],
-            "human_errors": stats["human_errors"],
-            "equipment_failures": stats["equipment_failures"],
-            "incidents": stats["incidents_count"],
-            "barrier_test_failures": stats["barrier_test_failures"],
-            "simops_conflicts": stats["simops_conflicts"],
-            "barrier_discipline_flag": stats["barrier_test_failures"] > 2 or stats["simops_conflicts"] > 1
+            "events_by_cause": stats.events_by_cause,
+            "non_compliant_arrivals": stats.non_compliant_on_arrival_count,
+            "human_errors": stats.human_errors,
+            "equipment_failures": stats.equipment_failures,
+            "incidents": stats.incidents_count,
+            "barrier_test_failures": stats.barrier_test_failures,
+            "simops_conflicts": stats.simops_conflicts,
+            "barrier_discipline_flag": stats.barrier_test_failures > 2 or stats.simops_conflicts > 1
         }
     
-    def _calculate_downtime_score(self, stats: Dict) -> float:
+    def _calculate_downtime_score(self, stats: CompanyStats) -> float:
         """Calculate downtime score (0-100, higher is better)"""
-        if stats["total_runs"] == 0:
-            return 0.0
-        
-        # Average downtime per run
-        avg_downtime = stats["downtime_minutes_total"] / stats["total_runs"]
-        
-        # Score calculation (less downtime = higher score)
-        # 0 min avg = 100, 120 min avg = 50, 240+ min avg = 0
-        if avg_downtime == 0:
-            return 100.0
-        elif avg_downtime >= 240:
-            return 0.0
-        else:
-            return max(0, 100 - (avg_downtime / 2.4))
-    
-    def _calculate_safety_score(self, stats: Dict) -> float:
+        return _downtime_score(stats.total_runs, stats.downtime_minutes_total)
+    
+    def _calculate_safety_score(self, stats: CompanyStats) -> float:
         """Calculate safety compliance score (0-100, higher is better)"""
-        score = 100.0
-        
-        # Deduct for issues
-        score -= stats["non_compliant_on_arrival_count"] * 15
-        score -= stats["human_errors"] * 10
-        score -= stats["incidents_count"] * 25
-        score -= stats["barrier_test_failures"] * 10
-        score -= stats["simops_conflicts"] * 5
-        
-        return max(0, min(100, score))
+        return _safety_score(
+            stats.non_compliant_on_arrival_count,
+            stats.human_errors,
+            stats.incidents_count,
+            stats.barrier_test_failures,
+            stats.simops_conflicts
+        )
     
     def calculate_equipment_score(self, equipment_id: str) -> Dict:
         """Calculate reliability score for specific equipment"""
-        stats = self.equipment_stats[equipment_id]
+        stats = self.equipment_stats.get(equipment_id) or EquipmentStats()
         
-        if stats["times_used"] == 0:
+        if stats.times_used == 0:
             return {"equipment_id": equipment_id, "score": None, "status": "NO_DATA"}
         
         # Failure rate
-        failure_rate = stats["failures"] / stats["times_used"]
+        failure_rate = stats.failures / stats.times_used
         
         # Score (higher = more reliable)
         reliability_score = max(0, 100 * (1 - failure_rate))
@@ -351,11 +494,11 @@ class DowntimeScorecardEngine:
         review_flag = False
         review_reasons = []
         
-        if stats["failures"] >= 3:
+        if stats.failures >= 3:
             review_flag = True
             review_reasons.append("Multiple failures")
         
-        if stats["non_conformances"] >= 2:
+        if stats.non_conformances >= 2:
             review_flag = True
             review_reasons.append("Multiple non-conformances")
         
@@ -365,12 +508,12 @@ class DowntimeScorecardEngine:
         
         return {
             "equipment_id": equipment_id,
-            "times_used": stats["times_used"],
-            "failures": stats["failures"],
-            "downtime_caused_minutes": stats["downtime_caused_minutes"],
+            "times_used": stats.times_used,
+            "failures": stats.failures,
+            "downtime_caused_minutes": stats.downtime_caused_minutes,
             "failure_rate": round(failure_rate * 100, 1),
             "reliability_score": round(reliability_score, 1),
-            "companies_involved": list(stats["companies_involved"]),
+            "companies_involved": list(stats.companies_involved),
             "retire_repair_review_flag": review_flag,
             "review_reasons": review_reasons
         }
@@ -378,25 +521,28 @@ class DowntimeScorecardEngine:
     def generate_full_scorecard(self) -> Dict:
         """Generate complete scorecard report"""
         
+        # Score every company and accumulate the summary totals in one pass
+        score_company = self._score_company
         company_scorecards = []
-        for company in self.company_stats.keys():
-            company_scorecards.append(self.calculate_company_score(company))
+        total_downtime = 0
+        total_incidents = 0
+        for company, stats in self.company_stats.items():
+            company_scorecards.append(score_company(company, stats))
+            total_downtime += stats.downtime_minutes_total
+            total_incidents += stats.incidents_count
         
-        equipment_scorecards = []
-        for equipment in self.equipment_stats.keys():
-            equipment_scorecards.append(self.calculate_equipment_score(equipment))
+        equipment_scorecards = [self.calculate_equipment_score(equipment)
+                                for equipment in self.equipment_stats]
         
         # Sort by reliability score
-        company_scorecards.sort(key=lambda x: x.get("reliability_score") or 0, reverse=True)
-        equipment_scorecards.sort(key=lambda x: x.get("reliability_score") or 0, reverse=True)
-        
-        # Summary stats
-        total_downtime = sum(s["downtime_minutes_total"] for s in self.company_stats.values())
-        total_incidents = sum(s["incidents_count"] for s in self.company_stats.values())
+        company_scorecards.sort(key=_reliability_key, reverse=True)
+        equipment_scorecards.sort(key=_reliability_key, reverse=True)
+        company_scores = _descending_scores(company_scorecards)
+        equipment_scores = _descending_scores(equipment_scorecards)
         
         return {
             "generated_at": datetime.now().isoformat(),
-            "total_runs_analyzed": len(self.runs),
+            "total_runs_analyzed": self.prior_runs + len(self.runs),
             "total_companies": len(self.company_stats),
             "total_equipment": len(self.equipment_stats),
             "total_downtime_minutes": total_downtime,
@@ -404,12 +550,12 @@ class DowntimeScorecardEngine:
             "company_scorecards": company_scorecards,
             "equipment_scorecards": equipment_scorecards,
             "worst_performers": {
-                "companies": [c for c in company_scorecards if c.get("reliability_score", 0) < 50][:5],
-                "equipment": [e for e in equipment_scorecards if e.get("reliability_score", 0) < 50][:5]
+                "companies": _below(company_scorecards, company_scores, 50),
+                "equipment": _below(equipment_scorecards, equipment_scores, 50)
             },
             "best_performers": {
-                "companies": [c for c in company_scorecards if c.get("reliability_score", 0) >= 80][:5],
-                "equipment": [e for e in equipment_scorecards if e.get("reliability_score", 0) >= 80][:5]
+                "companies": _at_least(company_scorecards, company_scores, 80),
+                "equipment": _at_least(equipment_scorecards, equipment_scores, 80)
             }
         }
 
@@ -429,12 +575,12 @@ def create_demo_run() -> InterventionRunRecord:
         date_end="2026-03-01T20:00:00Z",
         
         service_companies=[
-            {"name": "WirelineCo A", "role": "WIRELINE_SERVICE"},
-            {"name": "LiftingCo B", "role": "LIFTING"}
+            ServiceCompany(name="WirelineCo A", role="WIRELINE_SERVICE"),
+            ServiceCompany(name="LiftingCo B", role="LIFTING")
         ],
         
         contractors=[
-            {"name": "Contractor X", "role": "PCE_MAINTENANCE"}
+            ServiceCompany(name="Contractor X", role="PCE_MAINTENANCE")
         ],
         
         downtime_events=[
@@ -495,7 +641,7 @@ if __name__ == "__main__":
         run_id="DEMO-002",
         well_id="Stella_3_30",
         operation_type="WIRELINE",
-        service_companies=[{"name": "WirelineCo A", "role": "WIRELINE_SERVICE"}],
+        service_companies=[ServiceCompany(name="WirelineCo A", role="WIRELINE_SERVICE")],
         downtime_events=[
             DowntimeEvent(
                 duration_minutes=45,
@@ -511,7 +657,7 @@ if __name__ == "__main__":
         run_id="DEMO-003",
         well_id="Other_Well",
         operation_type="COILED_TUBING",
-        service_companies=[{"name": "CT_Services", "role": "CT_SERVICE"}],
+        service_companies=[ServiceCompany(name="CT_Services", role="CT_SERVICE")],
         downtime_events=[
             DowntimeEvent(
                 duration_minutes=180,
@@ -567,8 +713,13 @@ if __name__ == "__main__":
         print()
     
     # Save
-    with open("downtime_scorecard.json", "w") as f:
-        json.dump(scorecard, f, indent=2, default=str)
+    # Every scorecard value is already JSON-native, so no default= fallback
+    if orjson is not None:
+        with open("downtime_scorecard.json", "wb") as f:
+            f.write(orjson.dumps(scorecard, option=orjson.OPT_INDENT_2))
+    else:
+        with open("downtime_scorecard.json", "w") as f:
+            json.dump(scorecard, f, indent=2)
     
     print("=" * 60)
     print("📁 SAVED: downtime_scorecard.json")
@@ -10,9 +10,42 @@ import os
 import sys
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+def _copy_file(src, dst):
+    """Copy a file and its metadata (like shutil.copy2) via os.copy_file_range"""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        if os.path.realpath(src) == os.path.realpath(dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        # dst is a hardlink to src (e.g. staged by an older runner): replace
+        # the link, since writing through it would truncate the source
+        os.unlink(dst)
+
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        # Stopped short of st_size (e.g. pseudo-files or
+                        # filesystems copy_file_range cannot read): treat it
+                        # as unsupported rather than leave a truncated copy
+                        break
+                    remaining -= n
+            copied = remaining == 0
+        except OSError:
+            # Unsupported here (e.g. EXDEV across filesystems on older kernels)
+            pass
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
 class BrahanEngineFeeder:
     """Helper class to feed data to Brahan Engine"""
 
@@ -25,6 +58,18 @@ class BrahanEngineFeeder:
             'tiff': ['.tif', '.tiff'],
             'log': ['.log', '.txt', '.csv']
         }
+        self._ext_to_type = {ext: file_type
+                             for file_type, exts in self.supported_extensions.items()
+                             for ext in exts}
+
+    def _scan(self, directory, file_type=None):
+        """Supported files in directory (optionally of one type) as DirEntry objects"""
+        ext_to_type = self._ext_to_type
+        with os.scandir(directory) as it:
+            return [entry for entry in it
+                    if (ftype := ext_to_type.get(os.path.splitext(entry.name)[1].lower()))
+                    and (file_type is None or ftype == file_type)
+                    and entry.is_file()]
 
     def setup_directories(self):
         """Create directory structure for data feeding"""
@@ -55,8 +100,7 @@ class BrahanEngineFeeder:
         for file_type, subdir in [('pdf', 'pdf_files'), ('las', 'las_files'), ('tiff', 'tiff_files'), ('log', 'log_files')]:
             subdir_path = os.path.join(self.data_dir, subdir)
             if os.path.exists(subdir_path):
-                files = [f for f in os.listdir(subdir_path)
-                        if any(f.endswith(ext) for ext in self.supported_extensions[file_type])]
+                files = [entry.name for entry in self._scan(subdir_path, file_type)]
                 results[file_type] = files
                 print(f"   {file_type.upper()}: {len(files)} files")
                 for file in files[:5]:  # Show first 5
@@ -85,32 +129,37 @@ class BrahanEngineFeeder:
                 return False
         else:
             # Auto-detect file type
-            files_added = 0
-            for file_type, extensions in self.supported_extensions.items():
+            ext_to_type = self._ext_to_type
+            pairs = []
+            for entry in self._scan(source_path):
+                file_type = ext_to_type[os.path.splitext(entry.name)[1].lower()]
                 target_dir = os.path.join(self.data_dir, f"{file_type}_files")
-                for file in os.listdir(source_path):
-                    if any(file.endswith(ext) for ext in extensions):
-                        src = os.path.join(source_path, file)
-                        dst = os.path.join(target_dir, file)
-                        shutil.copy2(src, dst)
-                        files_added += 1
-                        print(f"   ✓ Copied: {file}")
+                pairs.append((entry.path, os.path.join(target_dir, entry.name)))
+            files_added = self._copy_all(pairs)
             print(f"✅ Added {files_added} files (auto-detected type)")
             return True
 
         # Copy files of specific type
-        files_copied = 0
-        for file in os.listdir(source_path):
-            if any(file.endswith(ext) for ext in self.supported_extensions[file_type]):
-                src = os.path.join(source_path, file)
-                dst = os.path.join(target_dir, file)
-                shutil.copy2(src, dst)
-                files_copied += 1
-                print(f"   ✓ Copied: {file}")
+        pairs = [(entry.path, os.path.join(target_dir, entry.name))
+                 for entry in self._scan(source_path, file_type)]
+        files_copied = self._copy_all(pairs)
 
         print(f"✅ Added {files_copied} {file_type.upper()} files")
         return True
 
+    def _copy_one(self, pair):
+        """Copy one (src, dst) pair; returns the file name"""
+        src, dst = pair
+        _copy_file(src, dst)
+        return os.path.basename(src)
+
+    def _copy_all(self, pairs, max_workers=8):
+        """Copy (src, dst) pairs concurrently; returns the number copied"""
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for file in pool.map(self._copy_one, pairs):
+                print(f"   ✓ Copied: {file}")
+        return len(pairs)
+
     def add_single_file(self, file_path, file_type=None):
         """Add a single file to the engine"""
         print(f"\n📄 Adding file: {file_path}")
@@ -121,10 +170,7 @@ class BrahanEngineFeeder:
 
         # Auto-detect file type if not specified
         if not file_type:
-            for ftype, extensions in self.supported_extensions.items():
-                if any(file_path.endswith(ext) for ext in extensions):
-                    file_type = ftype
-                    break
+            file_type = self._ext_to_type.get(os.path.splitext(file_path)[1].lower())
 
             if not file_type:
                 print("❌ Cannot determine file type")
@@ -136,7 +182,7 @@ class BrahanEngineFeeder:
 
         filename = os.path.basename(file_path)
         dst_path = os.path.join(target_dir, filename)
-        shutil.copy2(file_path, dst_path)
+        _copy_file(file_path, dst_path)
 
         print(f"✅ Added {file_type.upper()} file: {filename}")
         return True
@@ -215,16 +261,12 @@ class BrahanEngineFeeder:
         for file_type in ['pdf', 'las', 'log']:
             subdir = os.path.join(self.data_dir, f"{file_type}_files")
             if os.path.exists(subdir):
-                files = [f for f in os.listdir(subdir)
-                        if any(f.endswith(ext) for ext in self.supported_extensions[file_type])]
+                files = self._scan(subdir, file_type)
                 print(f"{file_type.upper()}: {len(files)} files")
                 total_files += len(files)
 
-                # Show file sizes
-                total_size = 0
-                for file in files:
-                    file_path = os.path.join(subdir, file)
-                    total_size += os.path.getsize(file_path)
+                # Show file sizes (DirEntry caches the stat)
+                total_size = sum(entry.stat().st_size for entry in files)
 
                 if total_size > 0:
                     size_mb = total_size / (1024 * 1024)
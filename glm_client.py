@@ -1,46 +1,165 @@
 #!/usr/bin/env python3
 """
 GLM-5 Client for WellTegra Forensic Engine
-Uses built-in urllib (no external dependencies)
+Uses built-in http.client (no external dependencies)
 """
 
-import urllib.request
-import urllib.error
+import hashlib
+import http.client
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/glm")
 
 class GLMClient:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_dir=None, cache=False):
         self.api_key = api_key or os.environ.get("ZAI_API_KEY")
         self.base_url = "https://api.z.ai/api/paas/v4/chat/completions"
         self.model = "glm-5"
         
         if not self.api_key:
             raise ValueError("Set ZAI_API_KEY environment variable")
+        
+        # One keep-alive HTTPS connection reused across calls, so only
+        # the first request pays for the TCP + TLS handshake
+        url = urlsplit(self.base_url)
+        self._host = url.netloc
+        self._path = url.path
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        self._conn = None
+        
+        # Caching is opt-in: it makes repeated prompts return the same
+        # completion. cache=True keeps completions in memory for this client;
+        # a cache_dir (e.g. DEFAULT_CACHE_DIR) also stores them on disk as
+        # <sha256>.json, readable by the owner only, to survive restarts
+        self.cache_dir = cache_dir
+        self.cache = cache or cache_dir is not None
+        self._memo = {}  # key -> JSON text, so every hit is a fresh copy
+    
+    def _cache_key(self, prompt, max_tokens):
+        return hashlib.sha256(f"{self.model}|{max_tokens}|{prompt}".encode('utf-8')).hexdigest()
+    
+    def _cache_get(self, key):
+        text = self._memo.get(key)
+        if text is None and self.cache_dir:
+            try:
+                with open(os.path.join(self.cache_dir, f"{key}.json"), encoding='utf-8') as f:
+                    text = f.read()
+            except OSError:
+                return None
+        if text is None:
+            return None
+        try:
+            result = json.loads(text)
+        except ValueError:
+            return None
+        self._memo[key] = text
+        return result
+    
+    def _cache_put(self, key, result):
+        text = self._memo[key] = json.dumps(result)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            path = os.path.join(self.cache_dir, f"{key}.json")
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
     
-    def chat(self, prompt, max_tokens=4096):
-        """Send prompt to GLM-5"""
+    def _post(self, body):
+        """POST body on the shared connection, returning (status, raw bytes)"""
+        reused = self._conn is not None
+        if not reused:
+            self._conn = http.client.HTTPSConnection(self._host)
+        
+        # Chat completions are not idempotent: only retry when a reused
+        # connection turns out to have been dropped by the server while idle,
+        # i.e. sending failed, or it closed without sending any response bytes.
+        # Timeouts and errors after a response has started are not retried.
+        try:
+            try:
+                self._conn.request("POST", self._path, body=body, headers=self._headers)
+                stale = False
+            except (BrokenPipeError, ConnectionResetError):
+                if not reused:
+                    raise
+                stale = True
+            if not stale:
+                try:
+                    response = self._conn.getresponse()
+                except http.client.RemoteDisconnected:
+                    if not reused:
+                        raise
+                    stale = True
+            if not stale:
+                return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        
+        # Retry once on a fresh connection
+        self.close()
+        return self._post(body)
+    
+    def close(self):
+        """Close the shared connection (reopened on the next call)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def chat(self, prompt, max_tokens=4096, no_cache=False):
+        """Send prompt to GLM-5 (served from the cache, if enabled, unless no_cache=True)"""
+        use_cache = self.cache and not no_cache
+        key = self._cache_key(prompt, max_tokens)
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+        
         data = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "max_tokens": max_tokens
         }
         
-        req = urllib.request.Request(
-            self.base_url,
-            data=json.dumps(data).encode('utf-8'),
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-        )
+        status, body = self._post(json.dumps(data).encode('utf-8'))
+        result = json.loads(body.decode('utf-8'))
+        if status >= 400:
+            return {"error": result}
+        if self.cache and "choices" in result:
+            self._cache_put(key, result)
+        return result
+
+    def chat_many(self, prompts, max_tokens=4096, max_workers=8, no_cache=False):
+        """Send several prompts concurrently; results come back in prompt order"""
+        # http.client connections are not thread-safe, so each worker
+        # thread gets its own client (and keep-alive connection)
+        local = threading.local()
+        clients = []
+        
+        def send(prompt):
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = GLMClient(self.api_key, self.cache_dir, self.cache)
+                client.model = self.model
+                client._memo = self._memo
+                clients.append(client)
+            return client.chat(prompt, max_tokens, no_cache)
         
         try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            return {"error": json.loads(e.read().decode('utf-8'))}
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(send, prompts))
+        finally:
+            for client in clients:
+                client.close()
 
 def main():
     client = GLMClient()
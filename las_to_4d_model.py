@@ -15,18 +15,41 @@ import os
 import re
 import json
 import math
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from dataclass_slots import slotted
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import from our 4D model
-exec(open('vision_three_4d_model.py').read().split('if __name__')[0])
+from vision_three_4d_model import (
+    ComponentType,
+    LifecycleState,
+    WellboreModel4D,
+    WellboreObject4D,
+)
 
 # ==============================================================================
 # DECAY MODELING
 # ==============================================================================
 
+# Wall loss % bands for CorrosionModel.assess_integrity()
+_WALL_LOSS_THRESHOLDS = (15, 30, 50)
+_INTEGRITY_BANDS = (
+    ("ACCEPTABLE", "Continue routine monitoring"),
+    ("MODERATE", "Monitor closely, plan intervention"),
+    ("SEVERE", "Plan replacement within 1 year"),
+    ("CRITICAL", "Immediate intervention required"),
+)
+
 @dataclass
 class CorrosionModel:
     """
@@ -56,11 +79,24 @@ class CorrosionModel:
     environment: str
     material_grade: str
     
+    # Derived once: inches/year for the environment, and the parsed
+    # installation date (parsed on first use, so non-ISO dates only
+    # fail when a prediction actually needs them)
+    rate_in_per_year: float = field(init=False, repr=False, compare=False)
+    _install_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.rate_in_per_year = self.CORROSION_RATES.get(self.environment, 0.1) / 25.4
+    
+    def install_datetime(self) -> datetime:
+        """Installation date as a datetime (cached)"""
+        if self._install_dt is None:
+            self._install_dt = datetime.fromisoformat(self.installation_date.replace('Z', ''))
+        return self._install_dt
+    
     def calculate_wall_loss(self, years: float) -> float:
         """Calculate wall loss in inches over time"""
-        rate_mm_per_year = self.CORROSION_RATES.get(self.environment, 0.1)
-        rate_in_per_year = rate_mm_per_year / 25.4
-        return rate_in_per_year * years
+        return self.rate_in_per_year * years
     
     def predict_remaining_life(self, min_wall_pct: float = 0.5) -> float:
         """Predict remaining life in years before min wall reached"""
@@ -71,17 +107,17 @@ class CorrosionModel:
             return 0
         
         remaining_wall = self.current_wall_thickness - min_wall
-        rate_in_per_year = self.CORROSION_RATES.get(self.environment, 0.1) / 25.4
+        rate_in_per_year = self.rate_in_per_year
         
         return remaining_wall / rate_in_per_year if rate_in_per_year > 0 else 999
     
     def get_wall_thickness_at_time(self, target_date: str) -> float:
         """Get predicted wall thickness at a future date"""
-        install = datetime.fromisoformat(self.installation_date.replace('Z', ''))
         target = datetime.fromisoformat(target_date.replace('Z', ''))
-        
-        years = (target - install).days / 365.25
-        
+        return self.get_wall_thickness_at_years((target - self.install_datetime()).days / 365.25)
+    
+    def get_wall_thickness_at_years(self, years: float) -> float:
+        """Get predicted wall thickness a number of years after installation"""
         if years < 0:
             return self.initial_wall_thickness
         
@@ -93,18 +129,9 @@ class CorrosionModel:
         wall_loss_pct = (1 - self.current_wall_thickness / self.initial_wall_thickness) * 100
         remaining_life = self.predict_remaining_life()
         
-        if wall_loss_pct > 50:
-            status = "CRITICAL"
-            action = "Immediate intervention required"
-        elif wall_loss_pct > 30:
-            status = "SEVERE"
-            action = "Plan replacement within 1 year"
-        elif wall_loss_pct > 15:
-            status = "MODERATE"
-            action = "Monitor closely, plan intervention"
-        else:
-            status = "ACCEPTABLE"
-            action = "Continue routine monitoring"
+        # bisect_left counts the thresholds strictly below the loss, so a
+        # loss of exactly 15/30/50% stays in the lower band
+        status, action = _INTEGRITY_BANDS[bisect_left(_WALL_LOSS_THRESHOLDS, wall_loss_pct)]
         
         return {
             "initial_wall": self.initial_wall_thickness,
@@ -115,6 +142,7 @@ class CorrosionModel:
             "recommended_action": action
         }
 
+@slotted
 @dataclass
 class DecayEvent:
     """A decay/degradation event over time"""
@@ -147,6 +175,15 @@ class DecayModel:
         
         self.decay_history: List[DecayEvent] = []
         self.current_date = datetime.now().isoformat()
+        self._install_day = None
+    
+    def install_day(self) -> datetime:
+        """Midnight of the installation date (cached)"""
+        if self._install_day is None:
+            self._install_day = datetime.fromisoformat(
+                self.corrosion_model.installation_date.replace('Z', '').split('T')[0] + 'T00:00:00'
+            )
+        return self._install_day
     
     def record_measurement(self, 
                            timestamp: str, 
@@ -170,14 +207,17 @@ class DecayModel:
     def predict_decay_to_time(self, target_timestamp: str) -> Dict:
         """Predict state of component at future time"""
         
-        install = datetime.fromisoformat(
-            self.corrosion_model.installation_date.replace('Z', '').split('T')[0] + 'T00:00:00'
-        )
-        target = datetime.fromisoformat(target_timestamp.replace('Z', '').split('T')[0] + 'T00:00:00')
+        # Parse the target once; wall loss uses the exact time, the reported
+        # elapsed years are counted between midnights
+        corrosion = self.corrosion_model
+        target = datetime.fromisoformat(target_timestamp.replace('Z', ''))
+        target_day = target.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        years = (target - install).days / 365.25
+        years = (target_day - self.install_day()).days / 365.25
         
-        predicted_wall = self.corrosion_model.get_wall_thickness_at_time(target_timestamp)
+        predicted_wall = corrosion.get_wall_thickness_at_years(
+            (target - corrosion.install_datetime()).days / 365.25
+        )
         wall_loss_pct = (1 - predicted_wall / self.corrosion_model.initial_wall_thickness) * 100
         
         return {
@@ -194,15 +234,54 @@ class DecayModel:
                                  step_years: int = 5) -> List[Dict]:
         """Generate complete decay timeline"""
         
+        # Same values as predict_decay_to_time() at each 1 January, but the
+        # install date and remaining life are worked out once, not per step
+        corrosion = self.corrosion_model
+        initial = corrosion.initial_wall_thickness
+        install = corrosion.install_datetime()
+        install_day = self.install_day()
+        remaining_life = round(corrosion.predict_remaining_life(), 1)
+        
         timeline = []
         
         for year in range(start_year, end_year + 1, step_years):
-            timestamp = f"{year}-01-01T00:00:00Z"
-            prediction = self.predict_decay_to_time(timestamp)
-            timeline.append(prediction)
+            target = datetime(year, 1, 1)
+            predicted_wall = corrosion.get_wall_thickness_at_years((target - install).days / 365.25)
+            
+            timeline.append({
+                "timestamp": f"{year}-01-01T00:00:00Z",
+                "years_elapsed": round((target - install_day).days / 365.25, 1),
+                "predicted_wall_thickness": round(predicted_wall, 3),
+                "wall_loss_pct": round((1 - predicted_wall / initial) * 100, 1),
+                "remaining_life_years": remaining_life
+            })
         
         return timeline
     
+    @staticmethod
+    def batch_timeline(models: List['DecayModel'],
+                       start_year: int,
+                       end_year: int,
+                       step_years: int = 5) -> List[List[float]]:
+        """
+        Predicted wall thickness (inches) at each 1 January for many components
+        Returns one row per model, matching predicted_wall_thickness from
+        generate_decay_timeline() before rounding
+        """
+        
+        # The target dates are shared by every model, so they are built once
+        # for the batch instead of once per model
+        targets = [datetime(year, 1, 1) for year in range(start_year, end_year + 1, step_years)]
+        
+        walls = []
+        for model in models:
+            corrosion = model.corrosion_model
+            install = corrosion.install_datetime()
+            at_years = corrosion.get_wall_thickness_at_years
+            walls.append([at_years((target - install).days / 365.25) for target in targets])
+        
+        return walls
+    
     def to_dict(self) -> Dict:
         """Export decay model"""
         return {
@@ -228,9 +307,40 @@ class DecayModel:
 # LAS FILE PARSER
 # ==============================================================================
 
+def _header_value(line: bytes) -> str:
+    """Decoded header text between the first '.' and the following ':'"""
+    return line.split(b'.')[1].split(b':')[0].strip().decode('utf-8', 'replace')
+
 class LasToModelLoader:
     """Load real data from LAS files into 4D model"""
     
+    # Below this many files, worker start-up costs more than it saves
+    PARALLEL_MIN_FILES = 16
+    
+    # First number in a header value (e.g. "FT 1500.0" -> 1500.0)
+    _NUM_RE = re.compile(rb'[\d.]+')
+    
+    # Start of the ~A (ASCII log data) section, which LAS 2.0 requires to
+    # be the last section in the file
+    _ASCII_SECTION_RE = re.compile(rb'^~A', re.MULTILINE | re.IGNORECASE)
+    
+    # Equipment type -> keywords that indicate it anywhere in a LAS file
+    EQUIPMENT_KEYWORDS = {
+        "CASING": (b"CASING", b"CSG"),
+        "TUBING": (b"TUBING", b"TBG"),
+        "PACKER": (b"PACKER", b"PKR"),
+        "DHSV": (b"DHSV", b"SSSV"),
+        "NIPPLE": (b"NIPPLE", b"LPN"),
+        "PLUG": (b"PLUG", b"BRIDGE")
+    }
+    
+    # All keywords as one alternation, so a file is scanned once rather
+    # than once per keyword. The only keywords that can overlap in text
+    # are LPN/NIPPLE, which map to the same type, so non-overlapping
+    # matches still find every type present.
+    _KEYWORD_TYPE = {kw: eq_type for eq_type, kws in EQUIPMENT_KEYWORDS.items() for kw in kws}
+    _EQUIPMENT_RE = re.compile(b'|'.join(map(re.escape, _KEYWORD_TYPE)))
+    
     def __init__(self, las_dir: str):
         self.las_dir = las_dir
         self.wells_data = defaultdict(lambda: {
@@ -247,86 +357,129 @@ class LasToModelLoader:
             print(f"LAS directory not found: {self.las_dir}")
             return
         
-        las_files = [f for f in os.listdir(self.las_dir) if f.endswith('.las')]
-        print(f"Found {len(las_files)} LAS files")
+        # scandir hands back full paths and a cached file type, so there is
+        # no separate join or stat per entry
+        with os.scandir(self.las_dir) as entries:
+            filepaths = [entry.path for entry in entries
+                         if entry.name.endswith('.las') and entry.is_file()]
+        print(f"Found {len(filepaths)} LAS files")
+        
+        # Parsing is CPU-bound and independent per file: fan large libraries
+        # out to worker processes (results come back in file order)
+        if len(filepaths) >= self.PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                parsed = list(executor.map(self.parse_las, filepaths, chunksize=8))
+        else:
+            parsed = map(self.parse_las, filepaths)
         
-        for filename in las_files:
-            filepath = os.path.join(self.las_dir, filename)
-            self._parse_las_file(filepath)
+        for record in parsed:
+            self._merge(record)
     
     def _parse_las_file(self, filepath: str):
         """Parse a single LAS file"""
+        self._merge(self.parse_las(filepath))
+    
+    @staticmethod
+    def parse_las(filepath: str) -> Optional[Tuple]:
+        """
+        Parse one LAS file without touching loader state
+        Returns (well_id, date, depth_range, curves, equipment) or None if unreadable
+        """
         
+        # LAS is an ASCII format: work on the raw bytes and decode only the
+        # captured header values, instead of decoding the whole file
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            with open(filepath, 'rb') as f:
                 content = f.read()
         except Exception as e:
-            return
-        
-        # Extract well info
-        well_id = "UNKNOWN"
-        for line in content.split('\n'):
-            if 'WELL' in line.upper() and '.' in line:
-                well_id = line.split('.')[1].split(':')[0].strip()
-                break
+            return None
         
-        # Extract date
-        date = ""
-        for line in content.split('\n'):
-            if 'DATE' in line.upper() and '.' in line:
-                date = line.split('.')[1].split(':')[0].strip()
-                break
+        # Uppercase the whole file once; it is split alongside the original
+        # bytes below and reused for the equipment scan
+        content_upper = content.upper()
         
-        if date:
-            self.wells_data[well_id]["dates"].append(date)
+        # Header fields and curves all live before the ~A section; the log
+        # data after it is usually the bulk of the file and holds only
+        # numbers, so it is not split into lines at all
+        ascii_section = LasToModelLoader._ASCII_SECTION_RE.search(content)
+        header_end = ascii_section.start() if ascii_section else len(content)
         
-        # Extract depth range (for trajectory)
+        # Single pass over the header lines: well name and date take the first
+        # match, the depth range the last, curves come from ~CURVE only
+        well_id = None
+        date = None
         strt = 0
         stop = 0
-        for line in content.split('\n'):
-            if 'STRT' in line.upper() and '.' in line:
-                match = re.search(r'[\d.]+', line.split('.')[1] if '.' in line else line)
-                if match:
-                    strt = float(match.group())
-            if 'STOP' in line.upper() and '.' in line:
-                match = re.search(r'[\d.]+', line.split('.')[1] if '.' in line else line)
-                if match:
-                    stop = float(match.group())
-        
-        if stop > strt:
-            self.wells_data[well_id]["depth_range"] = (strt, stop)
-        
-        # Extract curve mnemonics
+        curves = []
+        num_re = LasToModelLoader._NUM_RE
         in_curve = False
-        for line in content.split('\n'):
-            if '~CURVE' in line.upper():
-                in_curve = True
+        curves_done = False
+        
+        for line, upper in zip(content[:header_end].splitlines(),
+                               content_upper[:header_end].splitlines()):
+            has_dot = b'.' in line
+            
+            if has_dot:
+                if well_id is None and b'WELL' in upper:
+                    well_id = _header_value(line)
+                if date is None and b'DATE' in upper:
+                    date = _header_value(line)
+                if b'STRT' in upper:
+                    match = num_re.search(line.split(b'.')[1])
+                    if match:
+                        strt = float(match.group())
+                if b'STOP' in upper:
+                    match = num_re.search(line.split(b'.')[1])
+                    if match:
+                        stop = float(match.group())
+            
+            if curves_done:
                 continue
-            if line.startswith('~') and in_curve:
+            if b'~CURVE' in upper:
+                in_curve = True
+            elif in_curve:
+                if line.startswith(b'~'):
+                    curves_done = True
+                elif has_dot:
+                    curves.append(upper.split(b'.')[0].strip().decode('utf-8', 'replace'))
+        
+        if well_id is None:
+            well_id = "UNKNOWN"
+        
+        depth_range = (strt, stop) if stop > strt else None
+        
+        # Check for equipment mentions (anywhere in the file)
+        keyword_type = LasToModelLoader._KEYWORD_TYPE
+        all_types = LasToModelLoader.EQUIPMENT_KEYWORDS
+        found = set()
+        for match in LasToModelLoader._EQUIPMENT_RE.finditer(content_upper):
+            found.add(keyword_type[match.group()])
+            if len(found) == len(all_types):
                 break
-            if in_curve and '.' in line:
-                mnem = line.split('.')[0].strip().upper()
-                if mnem not in self.wells_data[well_id]["curves"]:
-                    self.wells_data[well_id]["curves"][mnem] = 0
-                self.wells_data[well_id]["curves"][mnem] += 1
+        equipment = [eq_type for eq_type in all_types if eq_type in found]
         
-        # Check for equipment mentions
-        content_upper = content.upper()
+        return well_id, date, depth_range, curves, equipment
+    
+    def _merge(self, record: Optional[Tuple]):
+        """Fold one parse_las() result into wells_data"""
+        if record is None:
+            return
+        well_id, date, depth_range, curves, equipment = record
         
-        equipment_types = {
-            "CASING": ["CASING", "CSG"],
-            "TUBING": ["TUBING", "TBG"],
-            "PACKER": ["PACKER", "PKR"],
-            "DHSV": ["DHSV", "SSSV"],
-            "NIPPLE": ["NIPPLE", "LPN"],
-            "PLUG": ["PLUG", "BRIDGE"]
-        }
+        if date:
+            self.wells_data[well_id]["dates"].append(date)
+        
+        if depth_range:
+            self.wells_data[well_id]["depth_range"] = depth_range
+        
+        # Curve mnemonics
+        if curves:
+            well_curves = self.wells_data[well_id]["curves"]
+            for mnem in curves:
+                well_curves[mnem] = well_curves.get(mnem, 0) + 1
         
-        for eq_type, keywords in equipment_types.items():
-            for kw in keywords:
-                if kw in content_upper:
-                    self.wells_data[well_id]["equipment"].append(eq_type)
-                    break
+        if equipment:
+            self.wells_data[well_id]["equipment"].extend(equipment)
     
     def build_model_for_well(self, well_id: str) -> Optional[WellboreModel4D]:
         """Build complete 4D model for a well"""
@@ -514,8 +667,12 @@ if __name__ == "__main__":
         "decay_timeline": timeline
     }
     
-    with open("las_4d_models_with_decay.json", "w") as f:
-        json.dump(export, f, indent=2, default=str)
+    if orjson is not None:
+        with open("las_4d_models_with_decay.json", "wb") as f:
+            f.write(orjson.dumps(export, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open("las_4d_models_with_decay.json", "w") as f:
+            json.dump(export, f, indent=2, default=str)
     
     print()
     print("=" * 70)
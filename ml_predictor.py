@@ -9,6 +9,11 @@ import os
 from collections import defaultdict
 import math
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class FailurePredictor:
@@ -17,6 +22,17 @@ class FailurePredictor:
     Features: Risk score, ghost fish, barriers, corrosion, pressure
     """
     
+    # Keys produced by extract_features()
+    FEATURE_KEYS = (
+        "ghost_fish_score",
+        "corrosion_score",
+        "pressure_anomaly",
+        "barrier_score",
+        "doc_completeness",
+        "integrity_score",
+        "risk_score"
+    )
+    
     def __init__(self):
         self.weights = {
             "ghost_fish": 0.25,
@@ -28,6 +44,8 @@ class FailurePredictor:
             "integrity_score": 0.10
         }
         self.models = {}
+        # well_id -> features, valid for the currently loaded data
+        self._feature_cache = {}
         
     def load_data(self):
         """Load all relevant JSON files"""
@@ -40,17 +58,33 @@ class FailurePredictor:
         }
         
         self.data = {}
+        self._feature_cache = {}
         for key, filename in files.items():
+            # Missing, unreadable or malformed files count as no data; anything
+            # else (e.g. KeyboardInterrupt) is not swallowed
             try:
-                with open(os.path.join(BASE_DIR, filename)) as f:
+                with open(os.path.join(BASE_DIR, filename), 'rb') as f:
                     self.data[key] = json.load(f)
-            except:
+            except (OSError, ValueError):
                 self.data[key] = {}
         
         return self.data
     
     def extract_features(self, well_id):
-        """Extract features for a single well"""
+        """Extract features for a single well (cached until the next load_data; treat as read-only)"""
+        features = self._feature_cache.get(well_id)
+        if features is None:
+            features = self._feature_cache[well_id] = self._extract_features(well_id, *self._tables())
+        return features
+    
+    def _tables(self):
+        """The (risk, integrity, compliance) sections of the loaded data"""
+        return (self.data.get("risk", {}),
+                self.data.get("integrity", {}),
+                self.data.get("compliance", {}))
+    
+    @staticmethod
+    def _extract_features(well_id, risk_table, integrity_table, compliance):
         features = {
             "ghost_fish_score": 0,
             "corrosion_score": 0,
@@ -61,7 +95,7 @@ class FailurePredictor:
         }
         
         # Risk score
-        risk = self.data.get("risk", {}).get(well_id, {})
+        risk = risk_table.get(well_id, {})
         features["risk_score"] = risk.get("score", 0) / 100
         
         # Ghost fish
@@ -70,24 +104,23 @@ class FailurePredictor:
             features["ghost_fish_score"] = 0.8
         
         # Integrity
-        integrity = self.data.get("integrity", {}).get(well_id, {})
+        integrity = integrity_table.get(well_id, {})
         features["integrity_score"] = integrity.get("score", 0) / 100
         
         # Compliance
-        compliance = self.data.get("compliance", {})
         features["doc_completeness"] = compliance.get("score", 100) / 100
         
         return features
     
     def predict(self, well_id):
         """Predict failure probability for a well"""
-        features = self.extract_features(well_id)
+        return self._predict(well_id, self.extract_features(well_id), self._weighted_terms())
+    
+    def _predict(self, well_id, features, terms):
+        """predict() with the features and (feature, weight) terms already resolved"""
         
         # Weighted sum
-        probability = 0
-        for feature, weight in self.weights.items():
-            if feature in features:
-                probability += features[feature] * weight
+        probability = self._weighted_sum(features, terms)
         
         # Apply sigmoid for probability (0-1)
         probability = 1 / (1 + math.exp(-10 * (probability - 0.5)))
@@ -100,6 +133,18 @@ class FailurePredictor:
             "recommendation": self.get_recommendation(probability)
         }
     
+    def _weighted_terms(self):
+        """(feature, weight) pairs for the weights that extract_features() supplies"""
+        return tuple((feature, weight) for feature, weight in self.weights.items()
+                     if feature in self.FEATURE_KEYS)
+    
+    @staticmethod
+    def _weighted_sum(features, terms):
+        probability = 0
+        for feature, weight in terms:
+            probability += features[feature] * weight
+        return probability
+    
     def get_recommendation(self, probability):
         if probability > 0.7:
             return "CRITICAL: Immediate intervention required"
@@ -123,13 +168,22 @@ class FailurePredictor:
     def predict_all(self):
         """Predict for all wells"""
         self.load_data()
-        predictions = {}
         
-        # Get all wells from risk scores
-        risk_data = self.data.get("risk", {})
+        # Get all wells from risk scores; resolve the weights and the data
+        # sections once for the batch rather than per well
+        tables = self._tables()
+        risk_data = tables[0]
+        terms = self._weighted_terms()
+        cache = self._feature_cache
+        extract = self._extract_features
+        predict = self._predict
         
-        for well_id in risk_data.keys():
-            predictions[well_id] = self.predict(well_id)
+        predictions = {}
+        for well_id in risk_data:
+            features = cache.get(well_id)
+            if features is None:
+                features = cache[well_id] = extract(well_id, *tables)
+            predictions[well_id] = predict(well_id, features, terms)
         
         return predictions
 
@@ -171,8 +225,12 @@ if __name__ == "__main__":
         print(f"{level} {well_id[:25]}: {prob}%")
     
     # Save
-    with open("ml_predictions.json", "w") as f:
-        json.dump(predictions, f, indent=2)
+    if orjson is not None:
+        with open("ml_predictions.json", "wb") as f:
+            f.write(orjson.dumps(predictions, option=orjson.OPT_INDENT_2))
+    else:
+        with open("ml_predictions.json", "w") as f:
+            json.dump(predictions, f, indent=2)
     
     print()
     print("📁 Saved to: ml_predictions.json")
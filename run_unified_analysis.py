@@ -15,15 +15,34 @@ Usage:
 import os
 import sys
 import argparse
+import functools
 import json
+from collections import Counter
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from UNIFIED_INTEGRATION import UnifiedForensicEngine, UnifiedConfig
 
+def _write_json(path, data):
+    """Write data as indented JSON (orjson when available), str() for non-JSON values"""
+    if orjson is not None:
+        # Passing datetimes through to default=str keeps the same text as json
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Run unified forensic analysis")
@@ -43,38 +62,35 @@ def parse_arguments():
 
     return parser.parse_args()
 
+@functools.lru_cache(maxsize=8)
+def _read_config(config_path, mtime_ns, size):
+    """Parsed config file; mtime and size are part of the key so edits are re-read"""
+    with open(config_path, 'rb') as f:
+        return orjson.loads(f.read()) if orjson is not None else json.load(f)
+
 def load_config(config_path):
     """Load configuration from JSON file"""
-    if config_path and os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-        # Handle empty project_airtight_dir
-        if 'project_airtight_dir' in config_data and config_data['project_airtight_dir'] == "":
-            config_data['project_airtight_dir'] = None
-        return UnifiedConfig(**config_data)
-    return None
+    if not config_path:
+        return None
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+
+    # Copy: the cached dict is shared between calls
+    config_data = dict(_read_config(config_path, stat.st_mtime_ns, stat.st_size))
+    # Handle empty project_airtight_dir
+    if 'project_airtight_dir' in config_data and config_data['project_airtight_dir'] == "":
+        config_data['project_airtight_dir'] = None
+    return UnifiedConfig(**config_data)
 
 def save_config(config, output_dir):
     """Save configuration to JSON file"""
-    config_data = {
-        'root_dir': config.root_dir,
-        'wellark_dir': config.wellark_dir,
-        'wellabuild_dir': config.wellabuild_dir,
-        'project_airtight_dir': config.project_airtight_dir,
-        'temporal_window_days': config.temporal_window_days,
-        'predicate_threshold': config.predicate_threshold,
-        'spatial_tolerance': config.spatial_tolerance,
-        'output_dir': config.output_dir,
-        'export_osdu': config.export_osdu,
-        'generate_visualization': config.generate_visualization,
-        'enable_audit': config.enable_audit,
-        'audit_signature': config.audit_signature,
-        'retention_days': config.retention_days
-    }
+    # Every UnifiedConfig field, so load_config() can round-trip new ones
+    config_data = asdict(config)
 
     config_path = os.path.join(output_dir, "config.json")
-    with open(config_path, 'w') as f:
-        json.dump(config_data, f, indent=2)
+    _write_json(config_path, config_data)
 
     return config_path
 
@@ -95,30 +111,35 @@ def validate_directories(config):
 
 def create_build_status_report(results, output_dir):
     """Create a comprehensive build status report"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # One clock read, so the file name and the report timestamp agree
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     report_path = os.path.join(output_dir, f"build_status_report_{timestamp}.json")
 
-    report = {
-        'timestamp': datetime.now().isoformat(),
-        'total_builds': len(results),
-        'successful_builds': sum(1 for r in results if r.status.value == 'COMPLETED'),
-        'failed_builds': sum(1 for r in results if r.status.value == 'FAILED'),
-        'partial_builds': sum(1 for r in results if r.status.value == 'PARTIAL'),
-        'build_details': []
-    }
-
+    # One pass over the results for both the status counts and the details
+    status_counts = Counter()
+    build_details = []
     for result in results:
-        build_detail = {
+        status = result.status.value
+        status_counts[status] += 1
+        build_details.append({
             'build_type': result.build_type.value,
-            'status': result.status.value,
+            'status': status,
             'timestamp': result.timestamp.isoformat(),
             'audit_hash': result.audit_hash,
-            'results_summary': self._summarize_results(result.results)
-        }
-        report['build_details'].append(build_detail)
+            'results_summary': _summarize_results(result.results)
+        })
+
+    report = {
+        'timestamp': now.isoformat(),
+        'total_builds': len(results),
+        'successful_builds': status_counts['COMPLETED'],
+        'failed_builds': status_counts['FAILED'],
+        'partial_builds': status_counts['PARTIAL'],
+        'build_details': build_details
+    }
 
-    with open(report_path, 'w') as f:
-        json.dump(report, f, indent=2, default=str)
+    _write_json(report_path, report)
 
     return report_path
 
@@ -8,10 +8,18 @@ Uses the data directories found in your wellabuild folder.
 
 import os
 import sys
-import shutil
 import json
 from pathlib import Path
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from runner_utils import FILE_EXTENSIONS, read_top_level, run_streamed, scan, stage_file
 
 def run_brahan_engine():
     """Run the Brahan Engine with your data"""
@@ -25,15 +33,16 @@ def run_brahan_engine():
         "tiff": "/home/brahan_welltegra/wellabuild/wellabuild/tiff_files"
     }
 
-    # Check directories exist
+    # Check directories exist (the listing made here is reused for staging)
     print("\n📁 Checking data directories...")
+    found = {}
     for file_type, path in data_dirs.items():
-        if os.path.exists(path):
-            file_count = len(list(Path(path).glob(f"*{'las' if file_type == 'las' else 'pdf' if file_type == 'pdf' else 'tif*'}")))
-            print(f"✅ {file_type.upper()} folder: {path} ({file_count} files)")
-        else:
+        try:
+            found[file_type] = scan(path, FILE_EXTENSIONS[file_type])
+        except (FileNotFoundError, NotADirectoryError):
             print(f"❌ {file_type.upper()} folder not found: {path}")
             return False
+        print(f"✅ {file_type.upper()} folder: {path} ({len(found[file_type])} files)")
 
     # Create engine directory
     engine_data = Path("brahan_engine_data")
@@ -48,21 +57,27 @@ def run_brahan_engine():
     print(f"\n📁 Engine directory created: {engine_data}")
 
     # Copy files
+    # Staged files are copies by default. BRAHAN_STAGE_LINKS=1 hardlinks them
+    # instead (no data copied), but then anything that later writes to a
+    # staged file in place also changes the original
     print("\n📂 Copying files to engine...")
-    total_files = 0
-
-    for file_type, source_dir in data_dirs.items():
+    link = os.environ.get("BRAHAN_STAGE_LINKS") == "1"
+    sources = []
+    targets = []
+    for file_type, entries in found.items():
         target_dir = engine_data / f"{file_type}_files"
-        extension = "las" if file_type == "las" else "pdf" if file_type == "pdf" else "tif*"
+        for entry in entries:
+            sources.append(entry.path)
+            targets.append(target_dir / entry.name)
 
-        files_copied = 0
-        for file_path in Path(source_dir).glob(f"*.{extension}"):
-            if file_path.is_file():
-                shutil.copy2(file_path, target_dir)
-                files_copied += 1
-                total_files += 1
+    # Staging is I/O-bound (read/write for copies, metadata ops for links):
+    # run all types through one pool to keep several requests in flight
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(stage_file, sources, targets, repeat(link)))
 
-        print(f"   ✓ Copied {files_copied} {file_type.upper()} files")
+    for file_type, entries in found.items():
+        print(f"   ✓ Copied {len(entries)} {file_type.upper()} files")
+    total_files = len(sources)
 
     print(f"\n📊 Total files copied: {total_files}")
 
@@ -92,8 +107,12 @@ def run_brahan_engine():
 
     # Save configuration
     config_file = Path("your_data_config.json")
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_file, 'w') as f:
+            json.dump(config, f, indent=2)
 
     print(f"\n📄 Configuration saved to: {config_file}")
 
@@ -103,12 +122,12 @@ def run_brahan_engine():
     print()
 
     try:
-        result = subprocess.run([
+        returncode, _ = run_streamed([
             sys.executable, "run_unified_analysis.py",
             "--config", str(config_file)
-        ], capture_output=True, text=True, timeout=300)  # 5 minute timeout
+        ], timeout=300, tail_lines=0)  # 5 minute timeout; output is not inspected
 
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Analysis completed successfully!")
 
             # Show output files
@@ -126,29 +145,29 @@ def run_brahan_engine():
 
                     # Try to show summary
                     try:
-                        with open(latest, 'r') as f:
-                            data = json.load(f)
-
-                            print("\n" + "="*50)
-                            print("📈 ANALYSIS SUMMARY")
-                            print("="*50)
-
-                            if 'summary' in data:
-                                for key, value in data['summary'].items():
-                                    print(f"{key}: {value}")
-                            elif 'build_results' in data:
-                                wellark = data['build_results'].get('wellark', {})
-                                wellabuild = data['build_results'].get('wellabuild', {})
-
-                                if wellark.get('status') == 'SUCCESS':
-                                    print("WellArk Analysis: ✅ Completed")
-                                if wellabuild.get('status') == 'SUCCESS':
-                                    print("WellABUILD Analysis: ✅ Completed")
-
-                                if 'total_findings' in data:
-                                    print(f"Total Findings: {data['total_findings']}")
-                            else:
-                                print("Analysis completed. Check JSON files for details.")
+                        # Only a few top-level keys are shown; the report can be large
+                        data = read_top_level(latest, ('summary', 'build_results', 'total_findings'))
+
+                        print("\n" + "="*50)
+                        print("📈 ANALYSIS SUMMARY")
+                        print("="*50)
+
+                        if 'summary' in data:
+                            for key, value in data['summary'].items():
+                                print(f"{key}: {value}")
+                        elif 'build_results' in data:
+                            wellark = data['build_results'].get('wellark', {})
+                            wellabuild = data['build_results'].get('wellabuild', {})
+
+                            if wellark.get('status') == 'SUCCESS':
+                                print("WellArk Analysis: ✅ Completed")
+                            if wellabuild.get('status') == 'SUCCESS':
+                                print("WellABUILD Analysis: ✅ Completed")
+
+                            if 'total_findings' in data:
+                                print(f"Total Findings: {data['total_findings']}")
+                        else:
+                            print("Analysis completed. Check JSON files for details.")
 
                     except Exception as e:
                         print(f"Could not parse summary: {e}")
@@ -157,8 +176,7 @@ def run_brahan_engine():
             return True
 
         else:
-            print("❌ Analysis failed:")
-            print(result.stderr)
+            print("❌ Analysis failed (see output above)")
             return False
 
     except subprocess.TimeoutExpired:
@@ -14,6 +14,8 @@ from pathlib import Path
 import subprocess
 from datetime import datetime
 
+from runner_utils import FILE_EXTENSIONS, scan
+
 def run_full_brahan_engine():
     """Run the full Brahan Engine with your data"""
     print("🚀 Brahan Engine - Full Analysis with Your Data")
@@ -26,12 +28,13 @@ def run_full_brahan_engine():
         "tiff": "/home/brahan_welltegra/wellabuild/wellabuild/tiff_files"
     }
 
-    # Check directories exist
+    # Check directories exist (the listing made here is reused for copying)
     print("\n📁 Checking data directories...")
+    found = {}
     for file_type, path in data_dirs.items():
         if os.path.exists(path):
-            file_count = len(list(Path(path).glob(f"*{'las' if file_type == 'las' else 'pdf' if file_type == 'pdf' else 'tif*'}")))
-            print(f"✅ {file_type.upper()} folder: {path} ({file_count} files)")
+            found[file_type] = scan(path, FILE_EXTENSIONS[file_type])
+            print(f"✅ {file_type.upper()} folder: {path} ({len(found[file_type])} files)")
         else:
             print(f"❌ {file_type.upper()} folder not found: {path}")
             return False
@@ -53,16 +56,14 @@ def run_full_brahan_engine():
     print("\n📂 Copying files to engine...")
     total_files = 0
 
-    for file_type, source_dir in data_dirs.items():
+    for file_type, entries in found.items():
         target_dir = engine_data / f"{file_type}_files"
-        extension = "las" if file_type == "las" else "pdf" if file_type == "pdf" else "tif*"
 
         files_copied = 0
-        for file_path in Path(source_dir).glob(f"*.{extension}"):
-            if file_path.is_file():
-                shutil.copy2(file_path, target_dir)
-                files_copied += 1
-                total_files += 1
+        for entry in entries:
+            shutil.copy2(entry.path, target_dir)
+            files_copied += 1
+            total_files += 1
 
         print(f"   ✓ Copied {files_copied} {file_type.upper()} files")
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Runner Utilities
+================
+
+Helpers shared by the run_with_* scripts: scanning the data folders,
+staging files for the engine, reading results and running the engine.
+"""
+
+import os
+import sys
+import shutil
+import json
+import subprocess
+import threading
+from collections import deque
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Extensions staged for each input type (matched case-insensitively)
+FILE_EXTENSIONS = {
+    "las": (".las",),
+    "pdf": (".pdf",),
+    "tiff": (".tif", ".tiff")
+}
+
+def scan(directory, extensions):
+    """Files in directory whose name ends in one of extensions, as DirEntry objects"""
+    # One scandir pass; DirEntry carries the file type, so there is no
+    # per-entry stat as with Path.glob() + is_file()
+    with os.scandir(directory) as it:
+        return [entry for entry in it
+                if entry.name.lower().endswith(extensions) and entry.is_file()]
+
+def stage_file(src, dst, link=False):
+    """Copy src to dst for the engine, or hardlink it when link=True"""
+    # Replace dst instead of writing through it: a hardlink left by an
+    # earlier run shares its inode with the user's source file
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+
+    if link:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass  # different filesystem (EXDEV) or links not permitted
+
+    # copy2 uses sendfile on Linux
+    shutil.copy2(src, dst)
+    return dst
+
+def read_top_level(path, keys):
+    """Top-level entries of a JSON object file, limited to keys"""
+    if ijson is None:
+        with open(path, 'rb') as f:
+            data = json.load(f)
+        return {key: data[key] for key in keys if key in data} if isinstance(data, dict) else {}
+
+    # Stream the file and build only the wanted values; everything else is
+    # tokenized and dropped, and reading stops once every key has been seen
+    found = {}
+    current = builder = None
+    depth = 0
+    with open(path, 'rb') as f:
+        for _, event, value in ijson.parse(f, use_float=True):
+            if depth == 1 and event == 'map_key':
+                current = value if value in keys else None
+                builder = ijson.ObjectBuilder() if current else None
+                continue
+            if builder is not None:
+                builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+            if builder is not None and depth == 1:
+                found[current] = builder.value
+                builder = None
+                if len(found) == len(keys):
+                    break
+    return found
+
+def run_streamed(cmd, timeout, tail_lines=200):
+    """
+    Run cmd, echoing its stdout and stderr as they arrive
+    Returns (returncode, last tail_lines lines of output); raises
+    subprocess.TimeoutExpired after killing the child if it outlives timeout
+    """
+    # Streaming keeps memory bounded and shows progress live, where
+    # capture_output would hold everything until the child exits
+    tail = deque(maxlen=tail_lines)
+    expired = threading.Event()
+    # A Python child block-buffers a piped stdout, which would hold its
+    # output back until exit; ask it to flush as it goes
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1, env=env) as proc:
+        def _expire():
+            expired.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _expire)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                tail.append(line)
+            proc.wait()
+        finally:
+            timer.cancel()
+
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, ''.join(tail)
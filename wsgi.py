@@ -0,0 +1,14 @@
+"""
+WellTegra Brahan Forensic Engine - WSGI entry point
+
+Production server:
+    gunicorn -k gevent -w 5 --worker-connections 1000 --preload -b 0.0.0.0:5000 wsgi:app
+
+With --preload the data files are parsed once in the master process and
+shared copy-on-write with the forked workers.
+"""
+
+from api_server import create_app, preload_data
+
+preload_data()
+app = create_app()